@@ -16,7 +16,7 @@ from numistalib.client import (
     NumistaClientAsync,
     NumistaClientSync,
 )
-from numistalib.config import Settings
+from numistalib.config import Settings, get_settings
 
 # Constants
 CACHE_HIT_ICON = "💾"
@@ -62,7 +62,7 @@ logger = logging.getLogger(LOGGER_NAME)
 logger.addHandler(handler)
 
 # Get environment file and initialize settings
-default_settings = Settings()
+default_settings = get_settings()
 
 __all__ = [
     "CACHE_HIT_ICON",
@@ -97,5 +97,6 @@ __all__ = [
     "Settings",
     "__version__",
     "default_settings",
+    "get_settings",
     "logger",
 ]
@@ -0,0 +1,292 @@
+"""Shared helpers for numistalib CLI command modules.
+
+Holds the runtime plumbing and shared option definitions that every
+command group needs (event loop execution, per-process service instances,
+``--lang``/``--limit``) so individual command modules stay focused on
+orchestration per AGENTS.md § 7.1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import importlib
+from collections.abc import Callable, Coroutine, Generator, Mapping
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, cast
+
+import click
+
+from numistalib.cli.theme import CLISettings
+from numistalib.client import NumistaClientAsync, NumistaClientSync
+from numistalib.config import Settings, get_settings
+
+# Services (and the models they pull in) load only when a command asks for one
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from numistalib.services import BaseService
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None  # type: ignore[assignment]
+
+# Case-insensitive choices hand back the canonical (interned literal) value, e.g. "FR" -> "fr",
+# so downstream code never needs its own .lower()
+LANGUAGES: tuple[str, ...] = ("en", "es", "fr")
+LANG_CHOICE = click.Choice(LANGUAGES, case_sensitive=False)
+LANG_OPTION = click.option("--lang", default="en", type=LANG_CHOICE, help="Language")
+CATEGORIES: tuple[str, ...] = ("coin", "banknote", "exonumia")
+CATEGORY_CHOICE = click.Choice(CATEGORIES, case_sensitive=False)
+PAGE_LIMIT_OPTION = click.option("--limit", type=int, default=50, help="Results per page")
+
+_PLURAL_SUFFIXES: tuple[str, str] = ("", "s")
+
+# Failures a command reports as a friendly message instead of a traceback
+CLI_ERRORS: tuple[type[Exception], ...] = (RuntimeError, OSError, ValueError)
+
+# Settings that shape the HTTP transport; clients built from equal values are interchangeable
+_TRANSPORT_KEY = attrgetter(
+    "api_key",
+    "api_base_url",
+    "timeout",
+    "http2",
+    "cache_dir",
+    "cache_db_name",
+    "rate_limit_requests",
+    "rate_limit_period",
+)
+
+# Per-process caches so repeated commands reuse one client/service and one loop.
+# Clients are keyed by (use_async, transport settings); None stands for the environment defaults.
+_CLIENTS: dict[tuple[bool, tuple[Any, ...] | None], NumistaClientSync | NumistaClientAsync] = {}
+_SERVICES: dict[tuple[type[BaseService], bool], BaseService] = {}
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported only when looked up.
+
+    Follows Click's "lazily loading subcommands" pattern: subcommands are
+    given as ``name -> "module.path:attribute"`` and their module is imported
+    the first time Click asks for that command, so unrelated invocations
+    never pay for its imports.
+
+    Parameters
+    ----------
+    *args : Any
+        Positional arguments for ``click.Group``
+    lazy_subcommands : Mapping[str, str] | None, optional
+        Subcommand name to ``"module:attribute"`` import path, by default None
+    **kwargs : Any
+        Keyword arguments for ``click.Group``
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: Mapping[str, str] | None = None, **kwargs: Any) -> None:
+        """Initialize the group with its lazily imported subcommands."""
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly registered and lazy subcommand names, sorted."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named subcommand, importing it on first use when lazy."""
+        import_path = self.lazy_subcommands.get(cmd_name)
+        if import_path is None:
+            return super().get_command(ctx, cmd_name)
+        return self._load(cmd_name, import_path)
+
+    @staticmethod
+    @functools.cache
+    def _load(cmd_name: str, import_path: str) -> click.Command:
+        """Import and return the command object at ``import_path`` (cached)."""
+        module_name, attribute = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy subcommand {cmd_name!r} ({import_path}) is not a click.Command")
+        return command
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the uvloop loop factory when installed, else the stdlib default."""
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def pluralize(count: int, noun: str) -> str:
+    """Return ``count`` followed by ``noun``, adding an ``s`` unless count is 1.
+
+    Parameters
+    ----------
+    count : int
+        Number of items
+    noun : str
+        Singular noun describing the items
+
+    Returns
+    -------
+    str
+        Count and noun, e.g. ``"1 issuer"`` or ``"3 issuers"``
+    """
+    return f"{count} {noun}{_PLURAL_SUFFIXES[count != 1]}"
+
+
+@functools.cache
+def _runner() -> asyncio.Runner:
+    """Return the process-wide runner whose loop owns the cached async clients."""
+    return asyncio.Runner(loop_factory=_loop_factory())
+
+
+def _client(use_async: bool, settings: Settings | None = None) -> NumistaClientSync | NumistaClientAsync:
+    """Return the cached sync or async client for ``settings``, building it on first use."""
+    settings = settings or get_settings()
+    key = (use_async, _TRANSPORT_KEY(settings))
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = Settings.to_async_client(settings) if use_async else Settings.to_client(settings)
+        _CLIENTS[key] = client
+    return client
+
+
+def get_client(settings: Settings | None = None) -> NumistaClientSync:
+    """Return the per-process synchronous client.
+
+    The client (connection pool, cache storage, rate limiter) is built once
+    per distinct set of transport settings and reused; all are closed at exit.
+
+    Parameters
+    ----------
+    settings : Settings | None, optional
+        Settings to build from; by default the cached environment settings
+        (``get_settings()``), which share a client with an explicit
+        ``get_settings()`` argument
+
+    Returns
+    -------
+    NumistaClientSync
+        Shared synchronous client
+    """
+    return cast(NumistaClientSync, _client(False, settings))
+
+
+def get_async_client(settings: Settings | None = None) -> NumistaClientAsync:
+    """Return the per-process asynchronous client bound to the shared CLI loop.
+
+    Only await it through :func:`run_async` so it stays on the loop it was
+    first used on. Cached per distinct set of transport settings; all are
+    closed at exit.
+
+    Parameters
+    ----------
+    settings : Settings | None, optional
+        Settings to build from; by default the cached environment settings
+        (``get_settings()``), which share a client with an explicit
+        ``get_settings()`` argument
+
+    Returns
+    -------
+    NumistaClientAsync
+        Shared asynchronous client
+    """
+    return cast(NumistaClientAsync, _client(True, settings))
+
+
+def get_service[ServiceT: BaseService](service_cls: type[ServiceT], *, use_async: bool = False) -> ServiceT:
+    """Return a per-process service instance bound to the cached client.
+
+    Parameters
+    ----------
+    service_cls : type[ServiceT]
+        Service class to instantiate
+    use_async : bool, optional
+        Bind the service to the async client instead of the sync one, by default False
+
+    Returns
+    -------
+    ServiceT
+        Cached service instance for ``(service_cls, use_async)``
+    """
+    key = (service_cls, use_async)
+    service = _SERVICES.get(key)
+    if service is None:
+        service = _SERVICES[key] = service_cls(_client(use_async))
+    return cast(ServiceT, service)
+
+
+@contextmanager
+def cli_service[ServiceT: BaseService](
+    service_cls: type[ServiceT], context: str, command: str, *, use_async: bool = False
+) -> Generator[tuple[Console, ServiceT]]:
+    """Yield the shared console and cached service for one CLI command.
+
+    Replaces the per-command console/service/``try`` preamble: any of
+    :data:`CLI_ERRORS` raised in the block is reported through
+    ``service.handle_cli_error``, which logs it and exits with status 1.
+
+    Parameters
+    ----------
+    service_cls : type[ServiceT]
+        Service class to fetch via :func:`get_service`
+    context : str
+        Human-readable operation for the error message (e.g., "listing mints")
+    command : str
+        Command name for log correlation (e.g., "mints-list")
+    use_async : bool, optional
+        Bind the service to the async client, by default False
+
+    Yields
+    ------
+    tuple[Console, ServiceT]
+        Shared console and service instance
+
+    Examples
+    --------
+    >>> with cli_service(MintService, "listing mints", "mints-list") as (console, service):
+    ...     console.print(service.MODEL.render_table(service.get_mints(), "Mints"))
+    """
+    service = get_service(service_cls, use_async=use_async)
+    try:
+        yield CLISettings.console(), service
+    except CLI_ERRORS as err:
+        service.handle_cli_error(err, context, command)
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared CLI event loop.
+
+    Uses ``uvloop`` when the optional ``numistalib[uvloop]`` extra is
+    installed and falls back to the stdlib loop otherwise. The loop is
+    reused across calls so async clients cached by :func:`get_service`
+    stay bound to a live loop.
+
+    Parameters
+    ----------
+    coro : Coroutine[Any, Any, T]
+        Coroutine to execute
+
+    Returns
+    -------
+    T
+        Result returned by the coroutine
+    """
+    return _runner().run(coro)
+
+
+def _shutdown() -> None:
+    """Close cached clients and the shared event loop at interpreter exit."""
+    _SERVICES.clear()
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        if isinstance(client, NumistaClientAsync):
+            run_async(client.aclose())
+        elif isinstance(client, NumistaClientSync):
+            client.close()
+    if _runner.cache_info().currsize:
+        _runner().close()
+
+
+atexit.register(_shutdown)
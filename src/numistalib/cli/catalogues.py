@@ -2,9 +2,10 @@
 
 
 import click
+from rich.console import Group
 
+from numistalib.cli.base import cli_service, pluralize
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
 from numistalib.services import CatalogueService
 
 # pyright: reportUnusedFunction = false
@@ -23,36 +24,23 @@ def register_catalogues_commands(parent: click.Group) -> None:
     @click.option("-t", "--table", is_flag=True, help="Render results as a table")
     def catalogues_cmd(table: bool) -> None:
         """List all reference catalogues (panel default, table with -t/--table)."""
-        console = CLISettings.console()
-        settings = Settings()
-        client = Settings.to_client(settings)
-        service = CatalogueService(client)
-        model_cls = service.MODEL
-
-        try:
+        with cli_service(CatalogueService, "listing catalogues", "cat-list") as (console, service):
             results = service.get_catalogues()
 
             if not results:
-                console.print("[warning]No catalogues found[/warning]")
+                CLISettings.print_warning("No catalogues found")
                 return
 
             if table:
-                output = model_cls.render_table(results, "Reference Catalogues")
+                output = service.MODEL.render_table(results, "Reference Catalogues")
                 console.print(output)
-                console.print(f"\n[success]Found {len(results)} catalogues[/success]")
+                CLISettings.print_success(f"\nFound {pluralize(len(results), 'catalogue')}")
                 return
 
-            # Panel-style rendering using model's as_panel() method
-            for catalogue in results:
-                panel = service._format_panel(catalogue)
-                console.print(panel)
-
-            console.print(
-                f"\n[success]Displayed {len(results)} catalogue{'s' if len(results) != 1 else ''}[/success]"
-            )
+            # Panel-style rendering using model's as_panel() method, printed in one pass
+            console.print(Group(*(service._format_panel(catalogue) for catalogue in results)))
 
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, "listing catalogues", "cat-list")
+            CLISettings.print_success(f"\nDisplayed {pluralize(len(results), 'catalogue')}")
 
     # Register both names
     parent.add_command(catalogues_cmd, name="catalogues")
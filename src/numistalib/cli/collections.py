@@ -29,8 +29,7 @@ def register_collections_commands(parent: click.Group) -> None:
         Examples:
             numistalib collections list 12345
         """
-        CLISettings.console()
-        CLISettings.console().print("[warning]Collections commands require OAuth authentication (not yet implemented)[/warning]")
+        CLISettings.print_warning("Collections commands require OAuth authentication (not yet implemented)")
 
     @collections.command(name="items")
     @click.argument("user_id", type=int)
@@ -42,5 +41,4 @@ def register_collections_commands(parent: click.Group) -> None:
             numistalib collections items 12345
             numistalib collections items 12345 --collection-id 67890
         """
-        CLISettings.console()
-        CLISettings.console().print("[warning]Collections commands require OAuth authentication (not yet implemented)[/warning]")
+        CLISettings.print_warning("Collections commands require OAuth authentication (not yet implemented)")
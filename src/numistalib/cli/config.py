@@ -5,7 +5,7 @@ import sys
 import click
 
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
+from numistalib.config import get_settings
 
 # pyright: reportUnusedFunction = false
 
@@ -33,24 +33,24 @@ def register_config_commands(parent: click.Group) -> None:
             numistalib config get api_key
             numistalib config get cache_dir
         """
+        console = CLISettings.console()
         try:
-            console = CLISettings.console()
-            settings = Settings()
+            settings = get_settings()
             value = getattr(settings, key.lower(), None)
             if value is None:
-                console.print(f"[danger]Setting '{key}' not found[/danger]")
+                CLISettings.print_error(f"Setting '{key}' not found")
                 sys.exit(1)
             console.print(f"[header]{key}:[/header] {value}")
         except (AttributeError, ValueError, KeyError) as err:
-            CLISettings.console().print(f"[danger]Error: {err}[/danger]")
+            CLISettings.print_error(f"Error: {err}")
             sys.exit(1)
 
     @config.command(name="list")
     def config_list() -> None:
         """List all configuration settings."""
+        console = CLISettings.console()
         try:
-            console = CLISettings.console()
-            settings = Settings()
+            settings = get_settings()
             table = CLISettings.create_table("numistalib Configuration")
             table.add_column("Setting")
             table.add_column("Value")
@@ -63,5 +63,5 @@ def register_config_commands(parent: click.Group) -> None:
 
             console.print(table)
         except (AttributeError, ValueError) as err:
-            CLISettings.console().print(f"[danger]Error: {err}[/danger]")
+            CLISettings.print_error(f"Error: {err}")
             sys.exit(1)
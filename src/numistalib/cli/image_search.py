@@ -26,5 +26,4 @@ def register_image_search_commands(parent: click.Group) -> None:
             numistalib search-image coin.jpg
             numistalib search-image coin.jpg --limit 20
         """
-        CLISettings.console()
-        CLISettings.console().print("[warning]Image search not yet implemented[/warning]")
+        CLISettings.print_warning("Image search not yet implemented")
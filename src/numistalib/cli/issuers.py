@@ -1,11 +1,10 @@
 """Issuers CLI commands."""
 
-import asyncio
-
 import click
+from rich.console import Group
 
+from numistalib.cli.base import LANG_OPTION, PAGE_LIMIT_OPTION, cli_service, pluralize, run_async
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
 from numistalib.models import Issuer
 from numistalib.services import IssuerService
 
@@ -22,18 +21,12 @@ def register_issuers_commands(parent: click.Group) -> None:
     """
 
     @click.command(name="issuers")
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
-    @click.option("--limit", type=int, default=50, help="Results per page")
+    @LANG_OPTION
+    @PAGE_LIMIT_OPTION
     @click.option("-t", "--table", is_flag=True, help="Render results as a table")
     def issuers(lang: str, limit: int, table: bool) -> None:
         """List issuing entities (panel default, table with -t/--table)."""
-        console = CLISettings.console()
-        settings = Settings()
-        client = Settings.to_async_client(settings)
-        service = IssuerService(client)
-        model_cls = service.MODEL
-
-        try:
+        with cli_service(IssuerService, "listing issuers", "isr-list", use_async=True) as (console, service):
             issuers_list: list[Issuer] = []
 
             async def consume_issuers() -> list[Issuer]:
@@ -42,24 +35,19 @@ def register_issuers_commands(parent: click.Group) -> None:
                     issuers_list.append(issuer)
                 return issuers_list
 
-            issuers_list = asyncio.run(consume_issuers())
+            issuers_list = run_async(consume_issuers())
 
             if not issuers_list:
-                console.print("[warning]No issuers found[/warning]")
+                CLISettings.print_warning("No issuers found")
                 return
 
             if table:
-                output = model_cls.render_table(issuers_list, "Issuers")
+                output = service.MODEL.render_table(issuers_list, "Issuers")
                 console.print(output)
             else:
-                for issuer in issuers_list:
-                    panel = service._format_panel(issuer)
-                    console.print(panel)
-
-            console.print(f"\n[success]Found {len(issuers_list)} issuer{'s' if len(issuers_list) != 1 else ''}[/success]")
+                console.print(Group(*(service._format_panel(issuer) for issuer in issuers_list)))
 
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, "listing issuers", "isr-list")
+            CLISettings.print_success(f"\nFound {pluralize(len(issuers_list), 'issuer')}")
 
     parent.add_command(issuers, name="issuers")
     parent.add_command(issuers, name="isr")
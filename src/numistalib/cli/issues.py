@@ -1,11 +1,10 @@
 """Issues CLI commands."""
 
-import asyncio
-
 import click
+from rich.console import Group
 
+from numistalib.cli.base import LANG_OPTION, PAGE_LIMIT_OPTION, cli_service, pluralize, run_async
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
 from numistalib.models import Issue
 from numistalib.services import IssueService
 
@@ -25,18 +24,14 @@ def register_issues_commands(parent: click.Group) -> None:
 
     @click.command(name="issues")
     @click.argument("type_id", type=int)
-    @click.option("--limit", type=int, default=50, help="Results per page")
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @PAGE_LIMIT_OPTION
+    @LANG_OPTION
     @click.option("-t", "--table", is_flag=True, help="Render results as a table")
     def issues(type_id: int, limit: int, lang: str, table: bool) -> None:
         """Show issues for a type (panel by default, table with -t/--table)."""
-        console = CLISettings.console()
-        settings = Settings()
-        client = Settings.to_async_client(settings)
-        service = IssueService(client)
-        model_cls = service.MODEL
+        context = f"listing issues for type {type_id}"
+        with cli_service(IssueService, context, "isu-list", use_async=True) as (console, service):
 
-        try:
             async def consume_issues() -> list[Issue]:
                 """Consume all issues from the paginated service."""
                 issues_list: list[Issue] = []
@@ -44,24 +39,19 @@ def register_issues_commands(parent: click.Group) -> None:
                     issues_list.append(issue)
                 return issues_list
 
-            issues_list = asyncio.run(consume_issues())
+            issues_list = run_async(consume_issues())
 
             if not issues_list:
-                console.print(f"[warning]No issues found for type {type_id}[/warning]")
+                CLISettings.print_warning(f"No issues found for type {type_id}")
                 return
 
             if table:
-                output = model_cls.render_table(issues_list, f"Issues for Type {type_id}")
+                output = service.MODEL.render_table(issues_list, f"Issues for Type {type_id}")
                 console.print(output)
             else:
-                for issue in issues_list:
-                    panel = service._format_panel(issue)
-                    console.print(panel)
-
-            console.print(f"\n[success]Found {len(issues_list)} issue{'s' if len(issues_list) != 1 else ''}[/success]")
+                console.print(Group(*(service._format_panel(issue) for issue in issues_list)))
 
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, f"listing issues for type {type_id}", "isu-list")
+            CLISettings.print_success(f"\nFound {pluralize(len(issues_list), 'issue')}")
 
     parent.add_command(issues, name="issues")
     parent.add_command(issues, name="isu")
@@ -6,6 +6,13 @@ from numistalib.cli.theme import CLISettings
 
 # pyright: reportUnusedFunction = false
 
+NOT_IMPLEMENTED_MESSAGE = "Literature commands not yet implemented"
+
+
+def _warn_not_implemented() -> None:
+    """Print the shared not-implemented warning for literature commands."""
+    CLISettings.print_warning(NOT_IMPLEMENTED_MESSAGE)
+
 
 def register_literature_commands(parent: click.Group) -> None:
     """Register literature commands with parent group.
@@ -29,16 +36,14 @@ def register_literature_commands(parent: click.Group) -> None:
         Examples:
             numistalib literature get 12345
         """
-        CLISettings.console()
-        CLISettings.console().print("[warning]Literature commands not yet implemented[/warning]")
+        _warn_not_implemented()
 
     @literature.command(name="search")
     @click.option("-q", "--query", required=True, help="Search query")
-    def literature_search(_query: str) -> None:
+    def literature_search(query: str) -> None:  # noqa: ARG001
         """Search literature catalogue.
 
         Examples:
             numistalib literature search -q "Krause"
         """
-        CLISettings.console()
-        CLISettings.console().print("[warning]Literature commands not yet implemented[/warning]")
+        _warn_not_implemented()
@@ -3,8 +3,8 @@
 
 import click
 
+from numistalib.cli.base import LANG_OPTION, cli_service, pluralize
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
 from numistalib.services import MintService
 
 # pyright: reportUnusedFunction = false
@@ -20,7 +20,7 @@ def register_mints_commands(parent: click.Group) -> None:
     """
 
     @parent.command()
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @LANG_OPTION
     def mints(lang: str) -> None:
         """List all mints.
 
@@ -28,44 +28,28 @@ def register_mints_commands(parent: click.Group) -> None:
             numistalib mints
             numistalib mints --lang es
         """
-        settings = Settings()
-        client = Settings.to_client(settings)
-        service = MintService(client)
-        model_cls = getattr(service, "MODEL", None)
-
-        try:
+        with cli_service(MintService, "listing mints", "mints-list") as (console, service):
             results = service.get_mints(lang=lang)
 
             if not results:
-                CLISettings.console().print("[warning]No mints found[/warning]")
+                CLISettings.print_warning("No mints found")
                 return
 
-            output = model_cls.render_table(results, "Mints")  # type: ignore[union-attr]
-            CLISettings.console().print(output)
-            CLISettings.console().print(f"\n[success]Found {len(results)} mints[/success]")
-
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, "listing mints", "mints-list")
+            output = service.MODEL.render_table(results, "Mints")
+            console.print(output)
+            CLISettings.print_success(f"\nFound {pluralize(len(results), 'mint')}")
 
     @parent.command(name="mint")
     @click.argument("mint_id", type=int)
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @LANG_OPTION
     def mint(mint_id: int, lang: str) -> None:
         """Show details for a specific mint."""
-        console = CLISettings.console()
-        settings = Settings()
-        client = Settings.to_client(settings)
-        service = MintService(client)
-
-        try:
+        with cli_service(MintService, f"retrieving mint {mint_id}", "mint-get") as (console, service):
             result = service.get_mint(mint_id, lang=lang)
 
             panel = service._format_panel(result)
             console.print(panel)
-            console.print("\n[success]Displayed mint details[/success]")
-
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, f"retrieving mint {mint_id}", "mint-get")
+            CLISettings.print_success("\nDisplayed mint details")
 
     # Alias for convenience
     parent.add_command(mint, name="mnt")
@@ -3,8 +3,8 @@
 
 import click
 
+from numistalib.cli.base import LANG_OPTION, cli_service, pluralize
 from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
 from numistalib.services import PriceService
 
 # pyright: reportUnusedFunction = false
@@ -23,29 +23,21 @@ def register_prices_commands(parent: click.Group) -> None:
     @click.argument("type_id", type=int)
     @click.argument("issue_id", type=int)
     @click.option("--currency", type=str, help="Currency code (e.g., USD, EUR)")
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @LANG_OPTION
     def prices(type_id: int, issue_id: int, currency: str | None, lang: str) -> None:
         """Get price estimates for an issue.
 
         Examples:
             numistalib prices 95420 123456
         """
-        settings = Settings()
-        client = Settings.to_client(settings)
-        service = PriceService(client)
-
-        model_cls = service.MODEL
-
-        try:
-
+        context = f"getting prices for type {type_id}, issue {issue_id}"
+        with cli_service(PriceService, context, "prices-get") as (console, service):
             prices_list = service.get_prices(type_id=type_id, issue_id=issue_id, currency=currency, lang=lang)
 
             if not prices_list:
-                CLISettings.console().print(f"[warning]No prices found for type {type_id}, issue {issue_id}[/warning]")
+                CLISettings.print_warning(f"No prices found for type {type_id}, issue {issue_id}")
                 return
 
-            output = model_cls.render_table(prices_list, f"Prices for Type {type_id}, Issue {issue_id}")
-            CLISettings.console().print(output)
-            CLISettings.console().print(f"\n[success]Found {len(prices_list)} price estimates[/success]")
-        except (RuntimeError, OSError, ValueError) as err:
-            service.handle_cli_error(err, f"getting prices for type {type_id}, issue {issue_id}", "prices-get")
+            output = service.MODEL.render_table(prices_list, f"Prices for Type {type_id}, Issue {issue_id}")
+            console.print(output)
+            CLISettings.print_success(f"\nFound {pluralize(len(prices_list), 'price estimate')}")
@@ -6,22 +6,156 @@ in line with AGENTS.md § 7.1 requirements.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from operator import attrgetter
 from sys import version_info
-from typing import Any, ClassVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from pydantic import BaseModel
 from rich import box
-from rich.align import AlignMethod
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
 from numistalib import __version__
 
+# Annotation-only imports (annotations are deferred via __future__)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.align import AlignMethod
+    from rich.live import Live
+
 # pyright: reportOptionalMemberAccess = false, reportUnknownMemberType = false
 
+# Column styling by semantic role: (style, no_wrap)
+_CACHE_COLUMN = "Cache"
+_CACHE_COLUMN_WIDTH = 6
+_EMPHASIZED_COLUMNS = frozenset({"ID", "Id", "Numista ID", "Numista Id", "Code"})
+_COLUMN_STYLE_CACHE: tuple[str, bool] = ("row_metadata", True)
+_COLUMN_STYLE_EMPHASIZED: tuple[str, bool] = ("row_emphasized", True)
+_COLUMN_STYLE_DEFAULT: tuple[str, bool] = ("row_data", False)
+
+# Per-type cell formatting; anything not listed falls back to str()
+_CELL_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: lambda value: value,
+    type(None): lambda _value: "",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _infer_columns(model_cls: type[BaseModel], include_cache: bool) -> tuple[str, ...]:
+    """Return humanized column names for ``model_cls`` (cached per class and cache flag)."""
+    # NumistaBaseModel precomputes its headers; other models get the same short, humanized field names
+    pretty_columns = getattr(model_cls, "pretty_columns", None)
+    if pretty_columns is not None:
+        columns: tuple[str, ...] = pretty_columns()
+    else:
+        columns = tuple(field_name.replace("_", " ").title() for field_name in model_cls.model_fields)
+    return (_CACHE_COLUMN, *columns) if include_cache else columns
+
+
+@functools.lru_cache(maxsize=128)
+def _column_widths(model_cls: type[BaseModel], include_cache: bool) -> tuple[int | None, ...]:
+    """Return declared column widths aligned with ``_infer_columns`` (cached per class and cache flag)."""
+    rich_widths = getattr(model_cls, "rich_widths", None)
+    declared: dict[str, int] = rich_widths() if rich_widths is not None else {}
+    widths = tuple(declared.get(field_name) for field_name in model_cls.model_fields)
+    return (_CACHE_COLUMN_WIDTH, *widths) if include_cache else widths
+
+
+@functools.lru_cache(maxsize=256)
+def _row_getter(model_cls: type[BaseModel]) -> Callable[[BaseModel], tuple[Any, ...]]:
+    """Return a callable fetching every field value in declaration order (cached per class)."""
+    names = tuple(model_cls.model_fields)
+    if len(names) > 1:
+        # One C-level call per row instead of a getattr per field
+        return attrgetter(*names)
+    # attrgetter returns a bare value for a single name and rejects zero names
+    return lambda model: tuple(getattr(model, name) for name in names)
+
+
+class BufferedConsole(Console):
+    """Rich Console that can assemble a line from fragments before printing.
+
+    ``write()`` only buffers; ``writeln()`` joins the buffered fragments and
+    emits them with a single ``print()`` call, so markup parsing and render
+    work happen once per line instead of once per fragment.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the console with an empty line buffer."""
+        super().__init__(*args, **kwargs)
+        self._line_buffer: list[str] = []
+
+    def write(self, text: str) -> None:
+        """Buffer a fragment of the current line without printing it."""
+        self._line_buffer.append(text)
+
+    def writeln(self, text: str = "", **kwargs: Any) -> None:
+        """Append ``text`` and print the buffered line with one ``print()`` call.
+
+        Parameters
+        ----------
+        text : str, optional
+            Final fragment of the line, by default ""
+        **kwargs : Any
+            Passed through to ``Console.print`` (e.g. ``style``)
+        """
+        self._line_buffer.append(text)
+        line = "".join(self._line_buffer)
+        self._line_buffer.clear()
+        self.print(line, **kwargs)
+
+
+class TableWriter:
+    """Batch rows into a table shown by Rich ``Live``.
+
+    Rows are buffered and flushed in chunks, refreshing the display at most
+    ``max_hz`` times per second so the frame cost stays bounded no matter
+    how quickly rows are produced.
+
+    Parameters
+    ----------
+    table : Table
+        Table displayed by ``live``
+    live : Live
+        Active Live display wrapping ``table``
+    max_hz : int, optional
+        Maximum refreshes per second, by default 30
+    chunk : int, optional
+        Pending rows that force a flush, by default 64
+    """
+
+    def __init__(self, table: Table, live: Live, max_hz: int = 30, chunk: int = 64) -> None:
+        """Initialize an empty writer for ``table``."""
+        self._table = table
+        self._live = live
+        self._min_interval = 1 / max_hz
+        self._chunk = chunk
+        self._pending: list[Sequence[str]] = []
+        self._last_flush = time.monotonic()
+        self.rows_written = 0
+
+    def add(self, row: Sequence[str]) -> None:
+        """Queue a row, flushing when the chunk is full or the refresh interval has elapsed."""
+        self._pending.append(row)
+        if len(self._pending) >= self._chunk or time.monotonic() - self._last_flush >= self._min_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Add all pending rows to the table and refresh the display once."""
+        if not self._pending:
+            return
+        CLISettings.add_rows(self._table, self._pending)
+        self.rows_written += len(self._pending)
+        self._pending.clear()
+        self._live.refresh()
+        self._last_flush = time.monotonic()
+
 
 class CLISettings:
     """Centralized CLI styling and formatting utilities.
@@ -42,7 +176,8 @@ class CLISettings:
     FIELD_TRUNCATE_LENGTH: int = 100
     FIELD_TRUNCATE_SUFFIX: str = "…"
 
-    CLI_THEME: ClassVar[dict[str, str]] = {
+    # Read-only: styles never change at runtime and the Theme built from them is cached
+    CLI_THEME: ClassVar[Mapping[str, str]] = MappingProxyType({
         # === Feedback / Status Messages ===
         "info": "bright_cyan",          # General informational text
         "success": "bold bright_green",  # Success states, confirmations
@@ -94,9 +229,11 @@ class CLISettings:
         "panel_warning": "bright_yellow",
         "panel_danger": "bright_red",
         "panel_default": "bright_blue",
-    }
+    })
 
     LICENSE_TEXT: str = "MIT License - See LICENSE file for details"
+    # Styled once at import; printing a Text needs no markup parsing
+    LICENSE_FOOTER: ClassVar[Text] = Text(LICENSE_TEXT, style="footer")
     PANEL_WIDTH: int = 120
     VERSION: str = __version__
     PANEL_BOX_STYLE: box.Box = box.ROUNDED
@@ -108,35 +245,51 @@ class CLISettings:
     TABLE_HIGHLIGHT: bool = True
     TABLE_SHOW_TITLE: bool = False
     TABLE_SHOW_HEADER: bool = True
-
-    # === Cached Rich Objects (lazy initialization) ===
-    _console: Console | None = None
-    _theme: Theme | None = None
+    DENSE_TABLE_ROWS: int = 500
+    STREAM_REFRESH_PER_SECOND: int = 10
 
     # === Public Accessors ===
     @classmethod
     def theme(cls) -> Theme:
         """Return the configured CLI theme (cached)."""
-        if cls._theme is None:
-            cls._theme = Theme(cls.CLI_THEME)
-        return cls._theme
+        return _get_theme()
+
+    @classmethod
+    def console(cls) -> BufferedConsole:
+        """Return a BufferedConsole with CLI theme applied (cached singleton)."""
+        return _get_console()
+
+    @classmethod
+    def bulk_console(cls) -> BufferedConsole:
+        """Return a themed console for bulk row output (cached singleton).
+
+        Also skips soft wrapping, which dominates the cost of printing long
+        tables; keep ``console()`` for panels and detail views.
+        """
+        return _get_bulk_console()
+
+    # === Status Messages ===
+    # The message is wrapped in a Text with a theme style, so it is never parsed as markup:
+    # one style lookup per line, and brackets in error text print literally
+    @classmethod
+    def print_success(cls, message: str) -> None:
+        """Print ``message`` in the ``success`` style."""
+        cls.console().print(Text(message, style="success"))
 
     @classmethod
-    def console(cls) -> Console:
-        """Return a Console instance with CLI theme applied (cached singleton)."""
-        if cls._console is None:
-            cls._console = Console(
-                theme=cls.theme(),
-                markup=True,
-                highlight=True,
-                width=cls.PANEL_WIDTH,
-                soft_wrap=True
-            )
-        return cls._console
+    def print_warning(cls, message: str) -> None:
+        """Print ``message`` in the ``warning`` style."""
+        cls.console().print(Text(message, style="warning"))
 
     @classmethod
+    def print_error(cls, message: str) -> None:
+        """Print ``message`` in the ``danger`` style."""
+        cls.console().print(Text(message, style="danger"))
+
+    @classmethod
+    @functools.cache
     def version_info(cls) -> str:
-        """Return formatted version string."""
+        """Return formatted version string (cached; it cannot change within a process)."""
         return f"numistalib CLI v{cls.VERSION} (Python {version_info.major}.{version_info.minor}.{version_info.micro})"
 
     # === Table Helpers ===
@@ -145,19 +298,28 @@ class CLISettings:
         cls,
         title: str | None = None,
         include_cache_column: bool = False,
+        row_count_hint: int | None = None,
     ) -> Table:
-        """Create a consistently styled table."""
+        """Create a consistently styled table.
+
+        Tables expected to hold more than ``DENSE_TABLE_ROWS`` rows
+        (``row_count_hint``) drop the zebra row styles and edge padding,
+        which otherwise cost a style lookup and extra segments per row.
+        """
+        dense = row_count_hint is not None and row_count_hint > cls.DENSE_TABLE_ROWS
         table = Table(
             title=title,
             show_header=cls.TABLE_SHOW_HEADER,
             header_style="table_header",
             title_justify="left",
-            row_styles=["row_even", "row_odd"],
+            row_styles=None if dense else ["row_even", "row_odd"],
             expand=cls.TABLE_EXPAND,
-            box=cls.TABLE_BOX_STYLE,
+            box=box.SIMPLE if dense else cls.TABLE_BOX_STYLE,
+            show_lines=False,
+            pad_edge=not dense,
         )
         if include_cache_column:
-            table.add_column("Cache", style="row_metadata", no_wrap=True, width=6)
+            table.add_column(_CACHE_COLUMN, style="row_metadata", no_wrap=True, width=_CACHE_COLUMN_WIDTH)
 
         return table
 
@@ -166,71 +328,97 @@ class CLISettings:
         cls,
         model_cls: type[BaseModel],
         include_cache: bool = False,
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Infer concise column names from a Pydantic model.
 
         Uses short, humanized field names instead of verbose descriptions.
         This prevents overly long headers when model field descriptions
-        contain detailed documentation.
+        contain detailed documentation. Results are cached per
+        ``(model_cls, include_cache)`` and returned as an immutable tuple.
         """
-        columns: list[str] = []
-
-        if include_cache:
-            columns.append("Cache")
+        return _infer_columns(model_cls, include_cache)
 
-        # Use model_fields for reliable ordering
-        for field_name, _field_info in model_cls.model_fields.items():
-            # Always use short, humanized field name
-            column_name = field_name.replace("_", " ").title()
-            columns.append(column_name)
+    @classmethod
+    def infer_column_widths_from_model(
+        cls,
+        model_cls: type[BaseModel],
+        include_cache: bool = False,
+    ) -> tuple[int | None, ...]:
+        """Return fixed column widths matching :meth:`infer_columns_from_model`.
 
-        return columns
+        Widths come from ``Field(json_schema_extra={"rich_width": n})`` on the
+        model; columns without one are ``None`` and stay auto-sized. Results
+        are cached per ``(model_cls, include_cache)``.
+        """
+        return _column_widths(model_cls, include_cache)
 
     @classmethod
     def add_columns_to_table(
         cls,
         table: Table,
         columns: Iterable[str],
+        widths: Sequence[int | None] | None = None,
     ) -> None:
-        """Add columns with appropriate styling based on semantic meaning."""
-        for column in columns:
-            if column == "Cache":
-                style = "row_metadata"
-                no_wrap = True
-            elif column in {"ID", "Id", "Numista ID", "Numista Id", "Code"}:
-                style = "row_emphasized"
-                no_wrap = True
+        """Add columns with appropriate styling based on semantic meaning.
+
+        When ``widths`` is given, each column with a non-``None`` width is fixed
+        to it without wrapping (overflow is ellipsized), so Rich can skip
+        measuring that column's cells.
+        """
+        for index, column in enumerate(columns):
+            if column == _CACHE_COLUMN:
+                style, no_wrap = _COLUMN_STYLE_CACHE
+            elif column in _EMPHASIZED_COLUMNS:
+                style, no_wrap = _COLUMN_STYLE_EMPHASIZED
             else:
-                style = "row_data"
-                no_wrap = False
+                style, no_wrap = _COLUMN_STYLE_DEFAULT
 
-            table.add_column(column, style=style, no_wrap=no_wrap)
+            width = widths[index] if widths else None
+            if width is None:
+                table.add_column(column, style=style, no_wrap=no_wrap)
+            else:
+                table.add_column(column, style=style, no_wrap=True, width=width, overflow="ellipsis")
 
     @classmethod
     def add_model_row(
         cls,
         table: Table,
         model_instance: BaseModel,
-        cache_indicator: str = "",
+        cache_indicator: str | None = None,
     ) -> None:
-        """Add a row from a Pydantic model instance, respecting column order."""
-        values: list[str] = []
+        """Add a row from a Pydantic model instance, respecting column order.
+
+        Pass ``cache_indicator`` only for tables created with
+        ``include_cache_column=True``; it fills the leading Cache cell.
+        """
+        # One cell per field in model_fields order (consistent with inferred columns)
+        cell_formatter = _CELL_FORMATTERS.get
+        cells = [cell_formatter(type(value), str)(value) for value in _row_getter(type(model_instance))(model_instance)]
+        if cache_indicator is None:
+            table.add_row(*cells)
+        else:
+            table.add_row(cache_indicator, *cells)
 
-        # Determine if first column is cache
-        has_cache_column = table.columns and table.columns[0].header == "Cache"
-        if has_cache_column:
-            values.append(cache_indicator)
+    @classmethod
+    def add_rows(cls, table: Table, rows: Iterable[Sequence[str]]) -> None:
+        """Append many rows of plain-text cells to ``table``.
 
-        # Add values in model_fields order (consistent with inferred columns)
-        for field_name in type(model_instance).model_fields:
-            if field_name in model_instance.model_fields_set or getattr(model_instance, field_name) is not None:
-                value = getattr(model_instance, field_name)
-                values.append(str(value) if value is not None else "")
+        Each cell is wrapped in a ``Text`` before ``Table.add_row``, so Rich
+        never parses the data as markup (a title containing ``[...]`` prints
+        literally) and skips the markup pass when rendering.
 
-        table.add_row(*values)
+        Parameters
+        ----------
+        table : Table
+            Table whose columns are already defined
+        rows : Iterable[Sequence[str]]
+            Row cells in column order
+        """
+        add_row = table.add_row
+        for row in rows:
+            add_row(*map(Text, row))
 
     # === Convenience Panel Helpers ===
-    # pyright
     @classmethod
     def panel(
         cls,
@@ -258,6 +446,13 @@ class CLISettings:
             **kwargs,
         )
 
+    # Pre-bound panel flavors: border style fixed at class definition, e.g. CLISettings.panel_warning(text)
+    panel_info = functools.partialmethod(panel, border_style="panel_info")
+    panel_success = functools.partialmethod(panel, border_style="panel_success")
+    panel_warning = functools.partialmethod(panel, border_style="panel_warning")
+    panel_danger = functools.partialmethod(panel, border_style="panel_danger")
+    panel_default = functools.partialmethod(panel, border_style="panel_default")
+
     @classmethod
     def format_detail_field(cls, label: str, value: Any) -> str:
         """Format a single detail field (wrapper around base formatting).
@@ -292,9 +487,38 @@ class CLISettings:
         str
             Newline-joined formatted fields
         """
-        # Simple wrapper that delegates field formatting
-        # Real formatting happens in model's format_fields() method
-        lines = []
-        for label, value in field_list:
-            lines.append(cls.format_detail_field(label, value))
-        return "\n".join(lines)
+        # Same template as format_detail_field, inlined to skip per-field calls and the list
+        return "\n".join(f"[label]{label}:[/label] {'—' if value is None else value}" for label, value in field_list)
+
+
+# === Cached Rich Objects (lazy initialization) ===
+# functools.cache singletons: one dict lookup per call once built, no check-then-act on class attributes
+@functools.cache
+def _get_theme() -> Theme:
+    """Build the CLI theme once per process."""
+    return Theme(CLISettings.CLI_THEME)
+
+
+@functools.cache
+def _get_console() -> BufferedConsole:
+    """Build the themed CLI console once per process."""
+    return BufferedConsole(
+        theme=_get_theme(),
+        markup=True,
+        # Styling comes from explicit markup/Text spans; the regex highlighter would rescan every body
+        highlight=False,
+        width=CLISettings.PANEL_WIDTH,
+        soft_wrap=True,
+    )
+
+
+@functools.cache
+def _get_bulk_console() -> BufferedConsole:
+    """Build the unhighlighted console used for streamed table rows once per process."""
+    return BufferedConsole(
+        theme=_get_theme(),
+        markup=True,
+        highlight=False,
+        width=CLISettings.PANEL_WIDTH,
+        soft_wrap=False,
+    )
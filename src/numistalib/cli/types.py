@@ -1,52 +1,303 @@
 """Types CLI commands."""
 
+from __future__ import annotations
+
 import asyncio
-from typing import Any
+import functools
+import sys
+from collections.abc import AsyncGenerator
+from contextlib import aclosing, suppress
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click
-from rich.table import Table
+from rich.console import Console, Group
+from rich.live import Live
+
+from numistalib.cli.base import CATEGORY_CHOICE, LANG_OPTION, get_service, pluralize, run_async
+from numistalib.cli.theme import CLISettings, TableWriter
 
-from numistalib.cli.theme import CLISettings
-from numistalib.config import Settings
-from numistalib.models import TypeBasic
-from numistalib.services import TypeBasicService, TypeFullService
+# Models and services are imported inside the functions that use them, so
+# loading this module (e.g. for --help) does not build the pydantic models
+if TYPE_CHECKING:
+    from numistalib.models import TypeBasic
+    from numistalib.services import TypeBasicService
 
 # pyright: reportOptionalMemberAccess = false
 # pyright: reportUnusedFunction = false
 
+# Rich output is flushed every N results so rendering overlaps with fetching the next page
+SEARCH_FLUSH_EVERY = 100
+SEARCH_SEPARATOR = "\n" + "─" * 80
+# Batches buffered ahead of the renderer; enough to hide request latency without holding many pages
+SEARCH_PREFETCH_BATCHES = 2
+# Search pages requested concurrently; the client's rate limiter still applies
+SEARCH_PAGE_CONCURRENCY = 4
+# Limits up to the API's maximum page size are served by one synchronous request, without an event loop
+SEARCH_SYNC_LIMIT = 100
+SEARCH_FORMATS = ("list", "table", "tsv", "json")
+SEARCH_FORMAT_CHOICE = click.Choice(SEARCH_FORMATS)
+# Column header for --format tsv, matching TypeBasic.render_plain
+SEARCH_TSV_HEADER = "id\ttitle\tcategory\tyear_range\tissuer\n"
+# Column headers for --format table, matching TypeBasic.plain_cells
+SEARCH_TABLE_COLUMNS = ("Numista ID", "Title", "Category", "Years", "Issuer")
+# TypeBasic fields behind SEARCH_TABLE_COLUMNS
+SEARCH_TABLE_FIELDS = ("numista_id", "title", "category", "year_range", "issuer")
+
+
+@functools.cache
+def _search_table_widths() -> tuple[int | None, ...]:
+    """Return the widths declared on the SEARCH_TABLE_FIELDS; free-text columns (None) stay auto-sized."""
+    from numistalib.models import TypeBasic
+
+    return tuple(map(TypeBasic.rich_widths().get, SEARCH_TABLE_FIELDS))
+
+
+async def _capped_pages(
+    service: TypeBasicService,
+    search_params: dict[str, Any],
+    max_results: int,
+) -> AsyncGenerator[list[TypeBasic]]:
+    """Yield search result pages, trimmed so no more than ``max_results`` results come out in total.
+
+    Stops requesting pages once the cap is reached and closes the service's
+    page generator on exit, so no fetches are left in flight.
+    """
+    remaining = max_results
+    pages = service.search_types_paginated_pages(
+        **search_params, max_results=max_results, concurrency=SEARCH_PAGE_CONCURRENCY
+    )
+    async with aclosing(pages) as pages:
+        async for page in pages:
+            # Only the final page can overshoot the cap; pass the others through uncopied
+            if len(page) >= remaining:
+                yield page[:remaining]
+                return
+            yield page
+            remaining -= len(page)
+
+
+async def _fill_search_queue(
+    service: TypeBasicService,
+    queue: asyncio.Queue[list[TypeBasic] | None],
+    search_params: dict[str, Any],
+    max_results: int,
+) -> None:
+    """Drain paginated search results into ``queue`` in batches of SEARCH_FLUSH_EVERY.
+
+    Whole pages are appended with ``list.extend`` rather than item by item.
+    A ``None`` sentinel is always queued last, also when fetching fails, so the
+    consumer never waits forever. A cancelled producer skips it: only the
+    consumer cancels it, and it no longer reads the (possibly full) queue.
+    """
+    batch: list[TypeBasic] = []
+    try:
+        async with aclosing(_capped_pages(service, search_params, max_results)) as pages:
+            async for page in pages:
+                batch.extend(page)
+                if len(batch) >= SEARCH_FLUSH_EVERY:
+                    await queue.put(batch)
+                    batch = []
+        if batch:
+            await queue.put(batch)
+    finally:
+        task = asyncio.current_task()
+        if task is None or not task.cancelling():
+            await queue.put(None)
+
+
+def _print_search_batch(console: Console, batch: list[TypeBasic], printed: int, max_rows: int | None) -> None:
+    """Print one batch as a Rich list, switching to plain lines once ``max_rows`` results are shown.
+
+    ``printed`` is the number of results already output by earlier batches.
+    """
+    from numistalib.models import TypeBasic
+
+    rich_rows = batch if max_rows is None else batch[: max(max_rows - printed, 0)]
+    if rich_rows:
+        if printed:
+            console.print(SEARCH_SEPARATOR)
+        console.print(TypeBasic.render_list(rich_rows))
+    for result in islice(batch, len(rich_rows), None):
+        console.print(result.render_plain(), markup=False, highlight=False)
+
+
+def _plain_lines(results: list[TypeBasic], as_json: bool) -> str:
+    """Return ``results`` as newline-terminated JSON or TSV lines, ready for a single write."""
+    if as_json:
+        return "".join(f"{result.model_dump_json()}\n" for result in results)
+    return "".join(f"{result.render_plain()}\n" for result in results)
+
+
+def _search_single_page(service: TypeBasicService, search_params: dict[str, Any]) -> list[TypeBasic]:
+    """Fetch up to ``limit`` results with one synchronous request (``limit`` <= SEARCH_SYNC_LIMIT)."""
+    from numistalib.services.types.service import SearchParams
+
+    params = dict(search_params)
+    limit = params.pop("limit")
+    return service.search_types(SearchParams(**params, count=limit))[:limit]
+
+
+def _print_search_page(results: list[TypeBasic], output_format: str, max_rows: int | None) -> int:
+    """Output an already fetched page of results in ``output_format``; returns the result count."""
+    if output_format in {"tsv", "json"}:
+        as_json = output_format == "json"
+        if not as_json:
+            sys.stdout.write(SEARCH_TSV_HEADER)
+        sys.stdout.write(_plain_lines(results, as_json))
+    elif output_format == "table":
+        table = CLISettings.create_table(row_count_hint=len(results))
+        CLISettings.add_columns_to_table(table, SEARCH_TABLE_COLUMNS, _search_table_widths())
+        CLISettings.add_rows(table, [result.plain_cells() for result in results])
+        CLISettings.bulk_console().print(table)
+    else:
+        _print_search_batch(CLISettings.console(), results, 0, max_rows)
+    return len(results)
+
 
 async def _consume_type_search_results(
     service: TypeBasicService,
-    table: Table,
+    console: Console,
     search_params: dict[str, Any],
+    max_results: int,
+    max_rows: int | None = None,
 ) -> int:
-    """Consume and display paginated type search results asynchronously.
+    """Stream paginated type search results to the console in batches.
+
+    Pages are fetched by a producer task into a bounded queue while the
+    current batch renders, so network latency overlaps with Rich output.
 
     Parameters
     ----------
     service : TypeBasicService
         The type service instance
-    table : Table
-        Rich table to add rows to
+    console : Console
+        Console to print results to
     search_params : dict[str, Any]
-        Search parameters (query, issuer, year, category, limit)
+        Search parameters (query, issuer, year, category, limit, lang)
+    max_results : int
+        Stop after this many results
+    max_rows : int | None, optional
+        Render at most this many results with Rich; the rest are printed as
+        plain text lines, by default None (no limit)
 
     Returns
     -------
     int
         Total count of results
     """
+    queue: asyncio.Queue[list[TypeBasic] | None] = asyncio.Queue(maxsize=SEARCH_PREFETCH_BATCHES)
+    producer = asyncio.create_task(_fill_search_queue(service, queue, search_params, max_results))
     count = 0
-    async for result in service.search_types_paginated(**search_params):
-        count += 1
-        CLISettings.add_model_row(  # Updated to use the refactored method
-            table,
-            result,
-            cache_indicator=service.last_cache_indicator,
-        )
+    try:
+        while (batch := await queue.get()) is not None:
+            _print_search_batch(console, batch, count, max_rows)
+            count += len(batch)
+        # Re-raise any error the producer hit after it queued the sentinel
+        await producer
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
     return count
 
 
+async def _write_plain_search_results(
+    service: TypeBasicService,
+    out: TextIO,
+    search_params: dict[str, Any],
+    max_results: int,
+    output_format: str,
+) -> int:
+    """Write search results to ``out`` as TSV or JSON lines, bypassing Rich.
+
+    Parameters
+    ----------
+    service : TypeBasicService
+        The type service instance
+    out : TextIO
+        Stream to write to (normally stdout)
+    search_params : dict[str, Any]
+        Search parameters (query, issuer, year, category, limit, lang)
+    max_results : int
+        Stop after this many results
+    output_format : str
+        ``"tsv"`` (header plus one tab-separated line per result) or ``"json"`` (JSON lines)
+
+    Returns
+    -------
+    int
+        Total count of results written
+    """
+    as_json = output_format == "json"
+    if not as_json:
+        out.write(SEARCH_TSV_HEADER)
+    written = 0
+    async with aclosing(_capped_pages(service, search_params, max_results)) as pages:
+        async for page in pages:
+            # One write per page rather than per row
+            out.write(_plain_lines(page, as_json))
+            written += len(page)
+    return written
+
+
+async def _stream_search_table(
+    service: TypeBasicService,
+    console: Console,
+    search_params: dict[str, Any],
+    max_results: int,
+) -> int:
+    """Render search results into a table that grows live as pages arrive.
+
+    Parameters
+    ----------
+    service : TypeBasicService
+        The type service instance
+    console : Console
+        Console the ``Live`` display draws on
+    search_params : dict[str, Any]
+        Search parameters (query, issuer, year, category, limit, lang)
+    max_results : int
+        Stop after this many results
+
+    Returns
+    -------
+    int
+        Number of rows rendered
+    """
+    table = CLISettings.create_table(row_count_hint=max_results)
+    CLISettings.add_columns_to_table(table, SEARCH_TABLE_COLUMNS, _search_table_widths())
+    with Live(
+        table,
+        console=console,
+        refresh_per_second=CLISettings.STREAM_REFRESH_PER_SECOND,
+        vertical_overflow="visible",
+    ) as live:
+        writer = TableWriter(table, live)
+        async with aclosing(_capped_pages(service, search_params, max_results)) as pages:
+            async for page in pages:
+                for result in page:
+                    writer.add(result.plain_cells())
+        writer.flush()
+    return writer.rows_written
+
+
+async def _stream_search(
+    service: TypeBasicService,
+    search_params: dict[str, Any],
+    max_results: int,
+    output_format: str,
+    max_rows: int | None,
+) -> int:
+    """Stream a multi-page search in ``output_format`` as pages arrive; returns the result count."""
+    if output_format in {"tsv", "json"}:
+        # Piped/scripted output: no Rich console, layout or markup at all
+        return await _write_plain_search_results(service, sys.stdout, search_params, max_results, output_format)
+    if output_format == "table":
+        return await _stream_search_table(service, CLISettings.bulk_console(), search_params, max_results)
+    return await _consume_type_search_results(service, CLISettings.console(), search_params, max_results, max_rows)
+
+
 def register_types_commands(parent: click.Group) -> None:
     """Register types commands with parent group."""
 
@@ -58,74 +309,85 @@ def register_types_commands(parent: click.Group) -> None:
     @click.option("-q", "--query", help="Full-text search query")
     @click.option("-i", "--issuer", help="Issuer code (e.g., 'united-states')")
     @click.option("-y", "--year", type=int, help="Filter by year")
-    @click.option("-c", "--category", type=click.Choice(["coin", "banknote", "exonumia"]), help="Category")
-    @click.option("--limit", type=int, default=50, help="Maximum total results")
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @click.option("-c", "--category", type=CATEGORY_CHOICE, help="Category")
+    @click.option("--limit", type=click.IntRange(min=1), default=50, help="Maximum total results")
+    @click.option("--max-rows", type=click.IntRange(min=0), help="Render at most N rich results, then plain text")
+    @click.option(
+        "--format",
+        "output_format",
+        type=SEARCH_FORMAT_CHOICE,
+        help="Output format (default: list on a terminal, tsv when piped); table streams rows live",
+    )
+    @LANG_OPTION
     def types_search(
         query: str | None,
         issuer: str | None,
         year: int | None,
         category: str | None,
         limit: int,
+        max_rows: int | None,
+        output_format: str | None,
         lang: str,
     ) -> None:
         """Search the catalogue for types."""
-        console = CLISettings.console()
-        settings = Settings()
-        client = Settings.to_async_client(settings)
-        service = TypeBasicService(client)
+        from numistalib.services import TypeBasicService
 
-        try:
-            # settings already created above
+        single_page = limit <= SEARCH_SYNC_LIMIT
+        service = get_service(TypeBasicService, use_async=not single_page)
+        search_params: dict[str, Any] = {
+            "query": query,
+            "issuer": issuer,
+            "year": year,
+            "category": category,
+            "limit": limit,
+            "lang": lang,
+        }
+        if output_format is None:
+            output_format = "list" if sys.stdout.isatty() else "tsv"
 
-            # Use model-driven table rendering for concise headers and values
+        plain = output_format in {"tsv", "json"}
 
-            search_params: dict[str, Any] = {
-                "query": query,
-                "issuer": issuer,
-                "year": year,
-                "category": category,
-                "limit": limit,
-                "lang": lang,
-            }
-
-            # Collect items via async pagination to pass to model's renderer
-            collected: list[TypeBasic] = []
-
-            async def _collect() -> None:
-                async for result in service.search_types_paginated(**search_params):
-                    collected.append(result)
-            asyncio.run(_collect())
-
-            # Render table using model's classmethod
-            output_table = TypeBasic.render_list(collected)
-            console.print(output_table)
-            result_count = len(collected)
+        try:
+            if single_page:
+                # One page covers the request; the event loop buys nothing without concurrent requests
+                result_count = _print_search_page(_search_single_page(service, search_params), output_format, max_rows)
+            else:
+                result_count = run_async(_stream_search(service, search_params, limit, output_format, max_rows))
 
+            if plain:
+                return
             if result_count == 0:
-                console.print("[warning]No results found[/warning]")
+                CLISettings.print_warning("No results found")
             else:
                 suffix = f" for '{query}'" if query else ""
-                console.print(f"\n[success]Displayed {result_count} result{'s' if result_count != 1 else ''}{suffix}[/success]")
+                CLISettings.print_success(f"\nDisplayed {pluralize(result_count, 'result')}{suffix}")
 
         except Exception as err:  # noqa: BLE001
             service.handle_cli_error(err, "searching types", "types-search")
 
     @types.command(name="get")
     @click.argument("type_id", type=int)
-    @click.option("--lang", default="en", type=click.Choice(["en", "es", "fr"]), help="Language")
+    @LANG_OPTION
     def types_get(type_id: int, lang: str) -> None:
         """Retrieve full details for a specific type by ID."""
-        CLISettings.console()
-        settings = Settings()
-        client = Settings.to_client(settings)
-        service = TypeFullService(client)
+        from numistalib.services import TypeFullService
+
+        console = CLISettings.console()
+        service = get_service(TypeFullService)
 
         try:
             result = service.get_type(type_id, lang=lang)
-            console = CLISettings.console()
-            for panel in result.render_detail(service.last_cache_indicator):
-                console.print(panel)
-            console.print(CLISettings.LICENSE_TEXT, style="footer")
+            # Sub-resources arrive inline; only the thumbnail images are separate downloads
+            result.prefetch_thumbnails()
+            # One print for all panels: a single measure/render pass and one write
+            console.print(
+                Group(
+                    *result.render_detail(service.last_cache_indicator),
+                    CLISettings.LICENSE_FOOTER,
+                )
+            )
         except Exception as err:  # noqa: BLE001
             service.handle_cli_error(err, f"retrieving type {type_id}", "types-get")
+
+
+__all__ = ["register_types_commands"]
@@ -0,0 +1,37 @@
+"""Users CLI subcommands, loaded on demand by the ``users`` group.
+
+Commands are declared as plain ``click.Command`` objects rather than via
+decorators, so importing this module builds each command exactly once.
+"""
+
+import click
+
+from numistalib.cli.theme import CLISettings
+
+
+def _users_get(user_id: int) -> None:  # noqa: ARG001
+    """Print the placeholder message for ``users get``."""
+    CLISettings.print_warning("User commands require OAuth authentication (not yet implemented)")
+
+
+def _users_search(query: str) -> None:  # noqa: ARG001
+    """Print the placeholder message for ``users search``."""
+    CLISettings.print_warning("User commands not yet implemented")
+
+
+users_get = click.Command(
+    name="get",
+    params=[click.Argument(["user_id"], type=int)],
+    callback=_users_get,
+    help="Get details about a user.\n\nExamples:\n    numistalib users get 12345",
+)
+
+users_search = click.Command(
+    name="search",
+    params=[click.Option(["-q", "--query"], required=True, help="Username search query")],
+    callback=_users_search,
+    help='Search for users.\n\nExamples:\n    numistalib users search -q "john"',
+)
+
+
+__all__ = ["users_get", "users_search"]
@@ -18,16 +18,27 @@ Legal & Attribution
 """
 
 import asyncio
+import importlib.util
 import logging
 import random
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+from functools import cached_property
+from pathlib import Path
 from typing import Any, Protocol
 
 import httpx
-from hishel import AsyncSqliteStorage, BaseFilter, FilterPolicy, Request, SyncSqliteStorage
-from hishel.httpx import AsyncCacheClient, SyncCacheClient
-from pyrate_limiter import Limiter, Rate
+from hishel import AsyncSqliteStorage, BaseFilter, FilterPolicy, Request, Response, SyncSqliteStorage
+from hishel.httpx import AsyncCacheClient, AsyncCacheTransport, SyncCacheClient, SyncCacheTransport
+from pyrate_limiter import Duration, Limiter, Rate
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 # Local constants to avoid circular imports
 CACHE_HIT_ICON = "💾"
@@ -43,11 +54,73 @@ LOGGER_NAME = "numistalib"
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_BACKOFF_BASE = 0.5  # seconds
 DEFAULT_BACKOFF_MAX = 5.0   # seconds
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_MAX_CONCURRENCY = 64  # in-flight requests per async client (AIMD ceiling)
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_INITIAL_CONCURRENCY = 4  # AIMD starting point; the limit ramps up from here
+DEFAULT_TARGET_LATENCY = 2.0  # seconds; grow concurrency only while responses come back faster
+AIMD_INCREASE = 0.5  # slots added per fast response
+AIMD_DECREASE = 0.5  # factor applied on 429, 5xx or a transport failure
+AIMD_LATENCY_WINDOW = 20  # recent network latencies averaged against the target
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds; httpx's 5s default drops the TLS session between paced requests
+_ABS_URL_PREFIXES: tuple[str, str] = ("http://", "https://")
+RATE_LIMIT_BUCKET = "numista"
+RATE_LIMIT_LOW_WATERMARK = 0.1  # pause proactively once the server reports <= 10% of the budget left
+
+# Failures worth another attempt: the request may not have reached the server, or it asked us to come back.
+# Anything else (invalid URL, unsupported protocol, 4xx) fails the same way on every retry.
+_TRANSIENT_ERRORS: tuple[type[httpx.HTTPError], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+# Failures before the request was sent; the only ones safe to retry for non-idempotent methods
+_CONNECT_ERRORS: tuple[type[httpx.HTTPError], ...] = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_RETRY_STATUS_TOO_MANY_REQUESTS = 429
+_RETRY_GATEWAY_STATUSES = frozenset({502, 503, 504})
+# A gateway error, read timeout or dropped connection may hide a request that was applied;
+# only replay methods that are safe to repeat
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# The cache is read-heavy: WAL lets cache-hit reads proceed while a response is written,
+# and NORMAL sync is durable enough for data that can always be refetched
+SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+# HTTP/2 needs the optional h2 package (numistalib[http2]); probe once without importing it
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 logger = logging.getLogger(LOGGER_NAME)
 _CLIENT_REGISTRY: list["NumistaClient"] = []
 
 
+class TunedSyncSqliteStorage(SyncSqliteStorage):
+    """Synchronous hishel storage that applies :data:`SQLITE_PRAGMAS` when it opens the database."""
+
+    def _initialize_database(self) -> None:
+        """Apply the pragmas, then create hishel's schema."""
+        assert self.connection is not None
+        for pragma in SQLITE_PRAGMAS:
+            self.connection.execute(pragma)
+        super()._initialize_database()
+
+
+class TunedAsyncSqliteStorage(AsyncSqliteStorage):
+    """Asynchronous hishel storage that applies :data:`SQLITE_PRAGMAS` when it opens the database."""
+
+    async def _initialize_database(self) -> None:
+        """Apply the pragmas, then create hishel's schema."""
+        assert self.connection is not None
+        for pragma in SQLITE_PRAGMAS:
+            await self.connection.execute(pragma)
+        await super()._initialize_database()
+
+
 class SyncClientProtocol(Protocol):
     """Synchronous client protocol returning NumistaResponse."""
 
@@ -99,9 +172,60 @@ class CacheAllGETRequests(BaseFilter[Request]):
         return item.method == "GET"
 
 
+class CacheSuccessfulResponses(BaseFilter[Response]):
+    """Filter to store only successful (2xx) responses in the cache.
+
+    Without it, a 429 or 5xx answer to a GET would be cached for the full
+    TTL and served to every retry instead of reaching the network again.
+    """
+
+    def needs_body(self) -> bool:  # noqa: PLR6301
+        """Indicate that we don't need to inspect the response body."""
+        return False
+
+    def apply(self, item: Response, body: bytes | None) -> bool:  # noqa: ARG002, PLR6301
+        """Apply filter: cache 2xx responses only.
+
+        Parameters
+        ----------
+        item : Response
+            The HTTP response to filter
+        body : bytes | None
+            Response body (not used)
+
+        Returns
+        -------
+        bool
+            True if the status code is 2xx
+        """
+        return httpx.codes.is_success(item.status_code)
+
+
 class NumistaResponse(httpx.Response):
     """Custom HTTP response to expose caching info."""
 
+    @classmethod
+    def from_httpx(cls, response: httpx.Response) -> "NumistaResponse":
+        """Return a ``NumistaResponse`` view sharing ``response``'s state.
+
+        Copies the instance ``__dict__`` (headers, stream, body, extensions)
+        by reference instead of reassigning ``response.__class__``, so the
+        original object keeps its type and no body bytes are copied.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            Response returned by the underlying client
+
+        Returns
+        -------
+        NumistaResponse
+            Response with cache indicator support
+        """
+        view = cls.__new__(cls)
+        view.__dict__.update(response.__dict__)
+        return view
+
     @property
     def cached(self) -> bool:
         """Determine if response was served from cache."""
@@ -112,6 +236,27 @@ class NumistaResponse(httpx.Response):
         """Get cache indicator based on response."""
         return str(CACHE_HIT_ICON if self.cached else CACHE_MISS_ICON)
 
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the JSON body.
+
+        Uses ``orjson`` when the optional ``numistalib[orjson]`` extra is
+        installed (the API always answers in UTF-8) and falls back to
+        ``httpx.Response.json`` otherwise, or when decoder options are given.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Options for ``json.loads``; forces the stdlib decoder
+
+        Returns
+        -------
+        Any
+            Decoded JSON document
+        """
+        if orjson is None or kwargs:
+            return super().json(**kwargs)
+        return orjson.loads(self.content)
+
 
 class NumistaClient(ABC):
     """Abstract base for Numista API clients (sync and async).
@@ -132,6 +277,8 @@ class NumistaClient(ABC):
         """
         self.api_key = kwargs.get("api_key")
         self.api_base_url = kwargs.get("api_base_url", "https://api.numista.com/v3")
+        # Joined with relative paths on every request; normalised once here
+        self._api_base = self.api_base_url.rstrip("/") + "/"
         self.rate_limit_period = kwargs.get("rate_limit_period", DEFAULT_RATE_LIMIT_PERIOD)
         self.rate_limit_requests = int(kwargs.get("rate_limit_requests", DEFAULT_RATE_LIMIT_REQUESTS))
         self.timeout = int(kwargs.get("timeout", DEFAULT_TIMEOUT))
@@ -139,11 +286,26 @@ class NumistaClient(ABC):
         self.database_cache_db = kwargs.get("database_cache_db", DEFAULT_CACHE_DB)
         self.default_ttl = int(kwargs.get("default_ttl", DEFAULT_CACHE_TTL))
         self.refresh_ttl_on_access = kwargs.get("refresh_ttl_on_access", DEFAULT_CACHE_REFRESH_ON_ACCESS)
+        self.limits = httpx.Limits(
+            max_connections=int(kwargs.get("max_connections", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive_connections=int(kwargs.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)),
+            keepalive_expiry=float(kwargs.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY)),
+        )
+        # Async client only: ceiling for the adaptive in-flight limit, so a large gather() cannot flood the pool
+        self.max_concurrency = int(kwargs.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        # None means "HTTP/2 whenever h2 is installed"; one connection then multiplexes concurrent requests
+        http2 = kwargs.get("http2")
+        self.http2 = H2_AVAILABLE if http2 is None else bool(http2)
         self._client: httpx.Client | httpx.AsyncClient | None = None
+        self._storage: SyncSqliteStorage | AsyncSqliteStorage | None = None
+        # Monotonic time before which no network request may start (set from rate-limit headers)
+        self._pause_until = 0.0
 
         if not self.api_key:
             raise ValueError("Numista API key is required via parameter or NUMISTA_API_KEY environment variable")
 
+        # Accept-Encoding is left to httpx: it advertises br/zstd itself once their decoders are
+        # installed (numistalib[compression]); naming an encoding it cannot decode would break responses
         self.headers = {
             "Numista-API-Key": self.api_key,
             # "User-Agent": f"numistalib/{__version__}",
@@ -160,13 +322,12 @@ class NumistaClient(ABC):
         finally:
             self._client = None
 
-    @property
+    @cached_property
     def database_full_path(self) -> str:
         """Get the full path to the cache database.
 
-        Creates the cache directory if it doesn't exist.
+        Creates the cache directory if it doesn't exist; resolved once per client.
         """
-        from pathlib import Path
         cache_dir = Path(self.database_cache_dir)
         cache_dir.mkdir(parents=True, exist_ok=True)
         return str(cache_dir / self.database_cache_db)
@@ -184,54 +345,133 @@ class NumistaClient(ABC):
         str
             Full URL
         """
-        if path.startswith(("http://", "https://")):
+        if path.startswith(_ABS_URL_PREFIXES):
             return path
-        return f"{self.api_base_url.rstrip('/')}/{path.lstrip('/')}"
+        return self._api_base + path.lstrip("/")
 
-    def _wrap_response(self, response: httpx.Response) -> NumistaResponse:  # noqa: PLR6301
-        """Wrap httpx.Response as NumistaResponse to expose cache indicators.
+    @staticmethod
+    def _jitter_delay(attempt: int) -> float:
+        """Compute exponential backoff with full jitter.
+
+        Draws uniformly from ``[0, min(base * 2**attempt, max))`` so clients
+        sharing one rate limit spread their retries instead of retrying together.
 
         Parameters
         ----------
-        response : httpx.Response
-            Raw HTTP response
+        attempt : int
+            Zero-based attempt number
 
         Returns
         -------
-        NumistaResponse
-            Response with cache indicator support
+        float
+            Sleep duration in seconds
         """
-        # Cast the response to NumistaResponse by setting its class
-        # This avoids re-reading the response body
-        response.__class__ = NumistaResponse
-        return response  # type: ignore
+        ceiling = min(DEFAULT_BACKOFF_BASE * (1 << attempt), DEFAULT_BACKOFF_MAX)
+        return random.uniform(0.0, ceiling)
 
     @staticmethod
-    def _jitter_delay(attempt: int) -> float:
-        """Compute exponential backoff with jitter.
+    def _should_retry(method: str, response: httpx.Response) -> bool:
+        """Return whether ``response`` is a transient failure worth another attempt.
+
+        A 429 is retried for any method (the server refused it outright);
+        502/503/504 only for idempotent methods.
+        """
+        status = response.status_code
+        if status == _RETRY_STATUS_TOO_MANY_REQUESTS:
+            return True
+        return status in _RETRY_GATEWAY_STATUSES and method.upper() in _IDEMPOTENT_METHODS
+
+    @staticmethod
+    def _should_retry_error(method: str, err: httpx.HTTPError) -> bool:
+        """Return whether a transient ``err`` may be retried for ``method``.
+
+        Idempotent methods retry any transient error; others only retry
+        failures to connect, since the server may already have applied them.
+        """
+        return method.upper() in _IDEMPOTENT_METHODS or isinstance(err, _CONNECT_ERRORS)
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Return how long to wait before retrying, preferring the server's ``Retry-After``.
 
         Parameters
         ----------
         attempt : int
             Zero-based attempt number
+        response : httpx.Response | None, optional
+            Response that triggered the retry, by default None (transport error)
 
         Returns
         -------
         float
             Sleep duration in seconds
         """
-        base = DEFAULT_BACKOFF_BASE * (2 ** attempt)
-        delay = min(base, DEFAULT_BACKOFF_MAX)
-        return float(delay * (0.5 + random.random()))
+        if response is not None and (retry_after := response.headers.get("Retry-After")) is not None:
+            with suppress(ValueError):
+                return max(float(retry_after), 0.0)
+        return self._jitter_delay(attempt)
 
-    @property
+    @cached_property
     def rate(self) -> Rate:
-        """Get the rate limit configuration."""
-        return Rate(self.rate_limit_requests, self.rate_limit_period)
+        """Get the rate limit configuration (``rate_limit_period`` seconds, as pyrate-limiter milliseconds)."""
+        return Rate(self.rate_limit_requests, int(self.rate_limit_period * Duration.SECOND))
 
-    @property
+    def _throttle_delay(self) -> float:
+        """Return how long to wait before the next network request may start (0 when it may start now).
+
+        Honours any pause requested by the server first, then takes a slot
+        from the client-side sliding window; when the window is full the
+        caller waits one slot interval and asks again.
+        """
+        pause = self._pause_until - time.monotonic()
+        if pause > 0:
+            return pause
+        if self.limiter.try_acquire(RATE_LIMIT_BUCKET):
+            return 0.0
+        return self.rate_limit_period / self.rate_limit_requests
+
+    def _throttle(self) -> None:
+        """Block until a network request may be sent."""
+        while (delay := self._throttle_delay()) > 0:
+            time.sleep(delay)
+
+    async def _athrottle(self) -> None:
+        """Wait, without blocking the event loop, until a network request may be sent."""
+        while (delay := self._throttle_delay()) > 0:
+            await asyncio.sleep(delay)
+
+    def _record_outcome(self, response: httpx.Response | None, sent_at: float) -> None:  # noqa: ARG002, PLR6301
+        """Report a finished network send (``None`` for a transient failure); the async client adapts to it."""
+        return
+
+    def _observe_rate_headers(self, response: httpx.Response) -> None:
+        """Schedule a pause from ``Retry-After`` or a nearly exhausted ``X-RateLimit-Remaining``.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            Response fresh from the network
+        """
+        headers = response.headers
+        pause = 0.0
+        with suppress(ValueError):
+            if (retry_after := headers.get("Retry-After")) is not None:
+                # Delay-seconds form only; the HTTP-date form is rare for API throttling
+                pause = float(retry_after)
+            elif (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+                left = int(remaining)
+                if left <= max(2, self.rate_limit_requests * RATE_LIMIT_LOW_WATERMARK):
+                    # Spread what is left of the budget over the rest of the window
+                    pause = self.rate_limit_period / max(left, 1)
+        if pause > 0:
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    @cached_property
     def limiter(self) -> Limiter:
-        """Get the rate limiter instance."""
+        """Get the rate limiter instance.
+
+        Built once per client: the limiter's bucket holds the sliding-window
+        state, so a fresh limiter per access would never throttle anything.
+        """
         return Limiter([self.rate], raise_when_fail=False)
 
     @property
@@ -263,17 +503,159 @@ class NumistaClient(ABC):
         pass
 
 
+class RateLimitedTransport(httpx.BaseTransport):
+    """Network transport that waits for the owning client's rate limiter before each request.
+
+    Parameters
+    ----------
+    transport : httpx.BaseTransport
+        Transport that performs the actual network I/O
+    owner : NumistaClient
+        Client whose limiter and server-requested pauses gate each request
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, owner: NumistaClient) -> None:
+        """Wrap ``transport`` with ``owner``'s throttling."""
+        self._transport = transport
+        self._owner = owner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a rate-limit slot, send ``request`` and record any throttling headers."""
+        self._owner._throttle()
+        response = self._transport.handle_request(request)
+        self._owner._observe_rate_headers(response)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of :class:`RateLimitedTransport`.
+
+    Parameters
+    ----------
+    transport : httpx.AsyncBaseTransport
+        Transport that performs the actual network I/O
+    owner : NumistaClient
+        Client whose limiter and server-requested pauses gate each request,
+        and which is told how each send went
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, owner: NumistaClient) -> None:
+        """Wrap ``transport`` with ``owner``'s throttling."""
+        self._transport = transport
+        self._owner = owner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a rate-limit slot, send ``request`` and record any throttling headers.
+
+        The send alone (not the throttle wait) is timed and reported to the
+        owner's concurrency controller, if it has one.
+        """
+        await self._owner._athrottle()
+        sent_at = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except _TRANSIENT_ERRORS:
+            self._owner._record_outcome(None, sent_at)
+            raise
+        self._owner._observe_rate_headers(response)
+        self._owner._record_outcome(response, sent_at)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit tuned by additive-increase/multiplicative-decrease (AIMD).
+
+    Starts at ``initial`` concurrent requests. Each fast network response
+    (rolling mean latency within the target) raises the limit by
+    ``AIMD_INCREASE``; server pressure (429, 5xx, transport failure)
+    multiplies it by ``AIMD_DECREASE``. A burst of failures from requests
+    that were already in flight counts as one signal: only requests sent
+    after the last decrease can lower the limit again. Requests wait in
+    :meth:`slot` while the number in flight has reached the current limit,
+    so a lowered limit takes effect as running requests finish.
+
+    Parameters
+    ----------
+    maximum : int
+        Upper bound on concurrent requests
+    minimum : int, optional
+        Lower bound on concurrent requests, by default DEFAULT_MIN_CONCURRENCY
+    initial : int, optional
+        Starting limit, clamped to ``[minimum, maximum]``, by default DEFAULT_INITIAL_CONCURRENCY
+    target_latency : float, optional
+        Mean latency in seconds below which the limit grows, by default DEFAULT_TARGET_LATENCY
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = DEFAULT_MIN_CONCURRENCY,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+    ) -> None:
+        """Start at ``initial`` concurrent requests with an empty latency window."""
+        self.maximum = max(maximum, 1)
+        self.minimum = min(max(minimum, 1), self.maximum)
+        self.target_latency = target_latency
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=AIMD_LATENCY_WINDOW)
+        # Monotonic time of the last decrease; earlier sends cannot trigger another one
+        self._decreased_at = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None]:
+        """Hold one request slot for the duration of the block."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Feed a network round-trip time; grow the limit while the window stays fast."""
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+            self.limit = min(self.maximum, self.limit + AIMD_INCREASE)
+
+    def record_congestion(self, sent_at: float) -> None:
+        """Back off after server pressure on a request sent at monotonic time ``sent_at``.
+
+        Requests sent before the previous decrease reflect the old limit and are ignored.
+        """
+        if sent_at < self._decreased_at:
+            return
+        self.limit = max(self.minimum, self.limit * AIMD_DECREASE)
+        self._decreased_at = time.monotonic()
+        self._latencies.clear()
+
+
 class NumistaClientSync(NumistaClient):
     """Synchronous Numista API client with caching and rate limiting."""
 
     @property
     def storage(self) -> SyncSqliteStorage:
-        """Get the synchronous cache storage instance."""
-        return SyncSqliteStorage(
-            database_path=self.database_full_path,
-            default_ttl=self.default_ttl,
-            refresh_ttl_on_access=self.refresh_ttl_on_access,
-        )
+        """Get the synchronous cache storage instance (built once, reused by ``client``)."""
+        if self._storage is None:
+            self._storage = TunedSyncSqliteStorage(
+                database_path=self.database_full_path,
+                default_ttl=self.default_ttl,
+                refresh_ttl_on_access=self.refresh_ttl_on_access,
+            )
+        return self._storage  # type: ignore
 
     @property
     def client(self) -> httpx.Client:
@@ -282,16 +664,16 @@ class NumistaClientSync(NumistaClient):
         Caches the client to prevent creating new instances on each request.
         """
         if self._client is None:
-            policy = FilterPolicy(request_filters=[CacheAllGETRequests()])
-            storage = self.storage
+            policy = FilterPolicy(request_filters=[CacheAllGETRequests()], response_filters=[CacheSuccessfulResponses()])
+            network = RateLimitedTransport(httpx.HTTPTransport(http2=self.http2, limits=self.limits), self)
             self._client = SyncCacheClient(
-                storage=storage,
+                storage=self.storage,
                 headers=self.headers,
                 timeout=self.timeout,
                 policy=policy,
+                # Throttling sits below the cache, so cache hits never spend rate-limit budget
+                transport=SyncCacheTransport(next_transport=network, storage=self.storage, policy=policy),
             )
-            # Keep a reference to storage so we can close it explicitly
-            self._storage = storage  # type: ignore[attr-defined]
         return self._client  # type: ignore
 
     def close(self) -> None:
@@ -300,47 +682,23 @@ class NumistaClientSync(NumistaClient):
                 self._client.close()  # type: ignore[attr-defined]
         finally:
             self._client = None
-        # Close hishel storage connection if present
-        storage = getattr(self, "_storage", None)
-        try:
-            if storage is not None and hasattr(storage, "close"):
-                storage.close()
-        finally:
-            if hasattr(self, "_storage"):
-                self._storage = None  # type: ignore[assignment]
+        # Close the hishel storage connection if it was opened; a later request builds a new one
+        storage, self._storage = self._storage, None
+        if isinstance(storage, SyncSqliteStorage):
+            storage.close()
 
-    def get(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make a synchronous GET request.
+    def _request(self, method: str, url: str, **kwargs: Any) -> NumistaResponse:
+        """Send a request, retrying transient failures with exponential backoff and jitter.
 
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
-
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        # Retry with exponential backoff and jitter
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = self.client.get(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                time.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: retry loop must return or raise")
-
-    def post(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make a synchronous POST request.
+        Timeouts, network errors and 429/502/503/504 responses are retried (see
+        :meth:`_should_retry_error` and :meth:`_should_retry`); non-idempotent
+        methods only retry connection failures and 429. Anything else is
+        returned or raised at once.
 
         Parameters
         ----------
+        method : str
+            HTTP method (e.g., "GET")
         url : str
             Request URL (relative or absolute)
         **kwargs : Any
@@ -352,93 +710,40 @@ class NumistaClientSync(NumistaClient):
             HTTP response with cache indicator
         """
         full_url = self._build_url(url)
+        last_attempt = DEFAULT_RETRY_ATTEMPTS - 1
         for attempt in range(DEFAULT_RETRY_ATTEMPTS):
             try:
-                response = self.client.post(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                time.sleep(self._jitter_delay(attempt))
+                response = self.client.request(method, full_url, **kwargs)
+            except _TRANSIENT_ERRORS as err:
+                if attempt == last_attempt or not self._should_retry_error(method, err):
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            if attempt == last_attempt or not self._should_retry(method, response):
+                return NumistaResponse.from_httpx(response)
+            response.close()
+            time.sleep(self._retry_delay(attempt, response))
         raise AssertionError("Unreachable: retry loop must return or raise")
 
-    def patch(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make a synchronous PATCH request.
+    def get(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make a synchronous GET request (see :meth:`_request`)."""
+        return self._request("GET", url, **kwargs)
 
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
+    def post(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make a synchronous POST request (see :meth:`_request`)."""
+        return self._request("POST", url, **kwargs)
 
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = self.client.patch(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                time.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
+    def patch(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make a synchronous PATCH request (see :meth:`_request`)."""
+        return self._request("PATCH", url, **kwargs)
 
     def put(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make a synchronous PUT request.
-
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
-
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = self.client.put(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                time.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
+        """Make a synchronous PUT request (see :meth:`_request`)."""
+        return self._request("PUT", url, **kwargs)
 
     def delete(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make a synchronous DELETE request.
-
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
-
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = self.client.delete(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                time.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
+        """Make a synchronous DELETE request (see :meth:`_request`)."""
+        return self._request("DELETE", url, **kwargs)
 
 
 class NumistaClientAsync(NumistaClient):
@@ -446,12 +751,14 @@ class NumistaClientAsync(NumistaClient):
 
     @property
     def storage(self) -> AsyncSqliteStorage:
-        """Get the asynchronous cache storage instance."""
-        return AsyncSqliteStorage(
-            database_path=self.database_full_path,
-            default_ttl=self.default_ttl,
-            refresh_ttl_on_access=self.refresh_ttl_on_access,
-        )
+        """Get the asynchronous cache storage instance (built once, reused by ``client``)."""
+        if self._storage is None:
+            self._storage = TunedAsyncSqliteStorage(
+                database_path=self.database_full_path,
+                default_ttl=self.default_ttl,
+                refresh_ttl_on_access=self.refresh_ttl_on_access,
+            )
+        return self._storage  # type: ignore
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -460,72 +767,54 @@ class NumistaClientAsync(NumistaClient):
         Caches the client to prevent creating new instances on each request.
         """
         if self._client is None:
-            policy = FilterPolicy(request_filters=[CacheAllGETRequests()])
+            policy = FilterPolicy(request_filters=[CacheAllGETRequests()], response_filters=[CacheSuccessfulResponses()])
+            network = AsyncRateLimitedTransport(httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits), self)
             self._client = AsyncCacheClient(
                 storage=self.storage,
                 headers=self.headers,
                 timeout=self.timeout,
                 policy=policy,
+                # Throttling sits below the cache, so cache hits never spend rate-limit budget
+                transport=AsyncCacheTransport(next_transport=network, storage=self.storage, policy=policy),
             )
         return self._client  # type: ignore
 
-    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make an asynchronous GET request.
-
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
+    @cached_property
+    def concurrency(self) -> AdaptiveConcurrency:
+        """Get the AIMD controller bounding concurrent requests (at most ``max_concurrency``).
 
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
+        Built on first use rather than in ``__init__`` so it is created from
+        inside the event loop that awaits it.
         """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = await self.client.get(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                await asyncio.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: retry loop must return or raise")
+        return AdaptiveConcurrency(self.max_concurrency)
 
-    async def post(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make an asynchronous POST request.
+    def _record_outcome(self, response: httpx.Response | None, sent_at: float) -> None:
+        """Feed a network send to :attr:`concurrency`: latency on success, congestion on 429/5xx or failure.
 
         Parameters
         ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
-
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
+        response : httpx.Response | None
+            Response headers as received, or None when the send raised a transient error
+        sent_at : float
+            Monotonic time the send started, after any throttle wait
         """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = await self.client.post(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                await asyncio.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: retry loop must return or raise")
+        if response is None or response.status_code == _RETRY_STATUS_TOO_MANY_REQUESTS or response.is_server_error:
+            self.concurrency.record_congestion(sent_at)
+        else:
+            self.concurrency.record_success(time.monotonic() - sent_at)
 
-    async def patch(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make an asynchronous PATCH request.
+    async def _arequest(self, method: str, url: str, **kwargs: Any) -> NumistaResponse:
+        """Send a request asynchronously, retrying transient failures with exponential backoff and jitter.
+
+        Same retry rules as :meth:`NumistaClientSync._request`. Sends go
+        through :attr:`concurrency`, whose limit adapts to the latency and
+        server pressure the network transport reports (backoff sleeps do not
+        hold a slot).
 
         Parameters
         ----------
+        method : str
+            HTTP method (e.g., "GET")
         url : str
             Request URL (relative or absolute)
         **kwargs : Any
@@ -537,67 +826,41 @@ class NumistaClientAsync(NumistaClient):
             HTTP response with cache indicator
         """
         full_url = self._build_url(url)
+        last_attempt = DEFAULT_RETRY_ATTEMPTS - 1
         for attempt in range(DEFAULT_RETRY_ATTEMPTS):
             try:
-                response = await self.client.patch(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                await asyncio.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
-
-    async def put(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make an asynchronous PUT request.
+                async with self.concurrency.slot():
+                    response = await self.client.request(method, full_url, **kwargs)
+            except _TRANSIENT_ERRORS as err:
+                if attempt == last_attempt or not self._should_retry_error(method, err):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            if attempt == last_attempt or not self._should_retry(method, response):
+                return NumistaResponse.from_httpx(response)
+            await response.aclose()
+            await asyncio.sleep(self._retry_delay(attempt, response))
+        raise AssertionError("Unreachable: retry loop must return or raise")
 
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
+    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make an asynchronous GET request (see :meth:`_arequest`)."""
+        return await self._arequest("GET", url, **kwargs)
 
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = await self.client.put(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                await asyncio.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
+    async def post(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make an asynchronous POST request (see :meth:`_arequest`)."""
+        return await self._arequest("POST", url, **kwargs)
 
-    async def delete(self, url: str, **kwargs: Any) -> NumistaResponse:
-        """Make an asynchronous DELETE request.
+    async def patch(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make an asynchronous PATCH request (see :meth:`_arequest`)."""
+        return await self._arequest("PATCH", url, **kwargs)
 
-        Parameters
-        ----------
-        url : str
-            Request URL (relative or absolute)
-        **kwargs : Any
-            Additional request parameters
+    async def put(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make an asynchronous PUT request (see :meth:`_arequest`)."""
+        return await self._arequest("PUT", url, **kwargs)
 
-        Returns
-        -------
-        NumistaResponse
-            HTTP response with cache indicator
-        """
-        full_url = self._build_url(url)
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                response = await self.client.delete(full_url, **kwargs)
-                return self._wrap_response(response)
-            except httpx.HTTPError as err:
-                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
-                    raise err
-                await asyncio.sleep(self._jitter_delay(attempt))
-        raise AssertionError("Unreachable: loop must return or raise")
+    async def delete(self, url: str, **kwargs: Any) -> NumistaResponse:
+        """Make an asynchronous DELETE request (see :meth:`_arequest`)."""
+        return await self._arequest("DELETE", url, **kwargs)
 
     async def aclose(self) -> None:
         """Close underlying HTTP client and storage if open."""
@@ -606,9 +869,9 @@ class NumistaClientAsync(NumistaClient):
                 await self._client.aclose()  # type: ignore[attr-defined]
         finally:
             self._client = None
-        storage = getattr(self, "_storage", None)
-        if storage is not None and hasattr(storage, "close"):
-            await storage.close()  # type: ignore[attr-defined]
+        storage, self._storage = self._storage, None
+        if isinstance(storage, AsyncSqliteStorage):
+            await storage.close()
 
 
 class NumistaApiClient:
@@ -5,6 +5,7 @@ Manages API keys, cache settings, rate limits via Pydantic BaseSettings.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from pydantic import Field
@@ -38,6 +39,8 @@ class Settings(BaseSettings):
         Maximum retry attempts for failed requests
     retry_max_wait : int
         Maximum wait time between retries (seconds)
+    http2 : bool | None
+        Use HTTP/2 (requires ``numistalib[http2]``); None enables it whenever ``h2`` is installed
     log_level : str
         Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
@@ -99,6 +102,10 @@ class Settings(BaseSettings):
         default=30.0,
         description="HTTP request timeout in seconds",
     )
+    http2: bool | None = Field(
+        default=None,
+        description="Use HTTP/2; None enables it when the optional h2 package is installed",
+    )
 
     # Cache Configuration
     cache_dir: Path = Field(
@@ -185,6 +192,7 @@ class Settings(BaseSettings):
             database_cache_db=settings.cache_db_name,
             rate_limit_requests=settings.rate_limit_requests,
             rate_limit_period=settings.rate_limit_period,
+            http2=settings.http2,
         )
 
     @classmethod
@@ -214,12 +222,31 @@ class Settings(BaseSettings):
             database_cache_db=settings.cache_db_name,
             rate_limit_requests=settings.rate_limit_requests,
             rate_limit_period=settings.rate_limit_period,
+            http2=settings.http2,
         )
 
 
-# get_settings() has been removed in favor of directly instantiating `Settings()`.
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide settings loaded from the environment.
+
+    Parsing environment variables and the ``.env`` file happens once; later
+    calls return the same instance. Call ``get_settings.cache_clear()`` to
+    reload after changing the environment (e.g. in tests).
+
+    Returns
+    -------
+    Settings
+        Shared settings instance
+
+    Examples
+    --------
+    >>> get_settings() is get_settings()
+    True
+    """
+    return Settings()
 
 
 # The helper functions `create_client_from_settings()` and
 # `create_async_client_from_settings()` were removed. Use
-# `Settings.to_client(Settings())` or `Settings.to_async_client(Settings())`.
+# `Settings.to_client(get_settings())` or `Settings.to_async_client(get_settings())`.
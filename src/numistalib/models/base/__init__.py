@@ -1,9 +1,10 @@
 """Base model classes and utilities for all Numista entity models."""
 
-from numistalib.models.base.base_model import NumistaBaseModel, RichField
+from numistalib.models.base.base_model import NumistaBaseModel, RichField, list_table
 
 __all__ = [
     "NumistaBaseModel",
     "RichField",
+    "list_table",
 
 ]
@@ -2,23 +2,60 @@
 
 Common configuration, behavior, and abstract base classes for Pydantic models.
 """
+import functools
 import re
 from abc import ABC
 from collections.abc import Iterable
+from itertools import chain
+from operator import attrgetter
 from typing import Any, Self
 
 import rich.repr
-from bs4 import BeautifulSoup
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
+from pydantic.fields import ComputedFieldInfo, FieldInfo
 from pydantic_core import core_schema
 from rich.console import Console, ConsoleOptions, Group, RenderableType
+from rich.table import Column, Table
 from rich.text import Text
 
 # Panel formatting constants
 PANEL_VALUE_COLUMN: int = 20
 PANEL_HANGING_INDENT: int = 5
 
+# Computed fields that hold presentation output rather than entity data
+_NON_DISPLAY_FIELDS = frozenset({"panel_template", "formatted_fields_dict"})
+
+
+def list_table(title: str, columns: Iterable[Column], **kwargs: Any) -> Table:
+    """Build the borderless list table used by model ``render_table`` methods.
+
+    Column definitions are module-level templates; each table gets fresh
+    copies because Rich stores a table's cells on its ``Column`` objects.
+
+    Parameters
+    ----------
+    title : str
+        Table title
+    columns : Iterable[Column]
+        Column templates, in display order
+    **kwargs : Any
+        Extra ``Table`` options (e.g., ``expand=True``)
+
+    Returns
+    -------
+    Table
+        Empty table with the given columns
+    """
+    return Table(
+        *(column.copy() for column in columns),
+        show_header=True,
+        box=None,
+        pad_edge=False,
+        title=title,
+        **kwargs,
+    )
+
 
 def safe(val: Any, default: str = "") -> str:
         """Return string representation or default if None or empty."""
@@ -48,6 +85,8 @@ def scrub(value: Any) -> str:
 
     # Check if value contains HTML
     if ("<" in text and ">" in text):
+        from bs4 import BeautifulSoup  # deferred: only needed for HTML values
+
         soup = BeautifulSoup(text, "html.parser")
 
         # Convert paragraphs to double newlines
@@ -122,19 +161,14 @@ def format_field(
     # Format label with Rich markup
     formatted_label = f"[label]{label}:[/label]"
 
-    # Detect multiline content
-    is_multiline = "\n" in cleaned_value
-    value_length = len(cleaned_value.split("\n")[0]) if is_multiline else len(cleaned_value)
-
-    if is_multiline:
+    if "\n" in cleaned_value:
         # Multiline: indent each line, add extra linefeed at end
-        lines = cleaned_value.split("\n")
+        # (single replace pass instead of split + per-line f-string + join)
         indent_str = " " * hanging_indent
-        indented_lines = [f"{indent_str}{line}" for line in lines]
-        formatted_value = "\n".join(indented_lines)
+        formatted_value = indent_str + cleaned_value.replace("\n", "\n" + indent_str)
         return f"{formatted_label}\n{formatted_value}\n"
 
-    elif value_length > 25:
+    elif len(cleaned_value) > 25:
         # Long single-line: start on next line at column 1, add extra linefeed
         return f"{formatted_label}\n{cleaned_value}\n"
 
@@ -179,6 +213,70 @@ class NumistaBaseModel(ABC, BaseModel):
             else:
                 yield name, value
 
+    @classmethod
+    @functools.cache
+    def field_labels(cls) -> dict[str, str]:
+        """Return humanized labels for regular and computed fields (cached per class).
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of field name to label, e.g. ``"start_year" -> "Start Year"``
+        """
+        names = (*cls.model_fields, *cls.model_computed_fields)
+        return {name: name.replace("_", " ").title() for name in names}
+
+    @classmethod
+    @functools.cache
+    def pretty_columns(cls) -> tuple[str, ...]:
+        """Return humanized column headers for the model's fields (cached per class).
+
+        Returns
+        -------
+        tuple[str, ...]
+            Labels in ``model_fields`` declaration order
+        """
+        labels = cls.field_labels()
+        return tuple(labels[name] for name in cls.model_fields)
+
+    @classmethod
+    @functools.cache
+    def rich_columns(cls) -> tuple[str, ...]:
+        """Return the displayable regular and computed field names (cached per class).
+
+        Presentation-only computed fields (``_NON_DISPLAY_FIELDS``) are left out.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Field names, regular fields first, in declaration order
+        """
+        return tuple(name for name in cls.field_labels() if name not in _NON_DISPLAY_FIELDS)
+
+    @classmethod
+    @functools.cache
+    def rich_widths(cls) -> dict[str, int]:
+        """Return fixed table column widths declared on fields (cached per class).
+
+        Fields opt in with ``Field(json_schema_extra={"rich_width": n})`` (or the
+        same on ``computed_field``); a known width lets Rich skip measuring every
+        cell of that column.
+
+        Returns
+        -------
+        dict[str, int]
+            Mapping of field name to column width, for fields that declare one
+        """
+        fields: Iterable[tuple[str, FieldInfo | ComputedFieldInfo]] = chain(
+            cls.model_fields.items(), cls.model_computed_fields.items()
+        )
+        widths: dict[str, int] = {}
+        for name, info in fields:
+            extra = info.json_schema_extra
+            if isinstance(extra, dict) and isinstance(width := extra.get("rich_width"), int):
+                widths[name] = width
+        return widths
+
     def to_api_dict(self, **kwargs: Any) -> dict[Any, Any]:
         """Return dict suitable for sending back to API or clean export.
         Uses aliases, excludes None by default.
@@ -196,6 +294,7 @@ class NumistaBaseModel(ABC, BaseModel):
 
         Automatically formats all fields (regular and computed) in the model
         using format_field() with default column alignment and indentation.
+        Rebuilt on every access; callers that need it repeatedly bind it locally.
 
         Returns
         -------
@@ -203,23 +302,13 @@ class NumistaBaseModel(ABC, BaseModel):
             Dictionary mapping field names to formatted field strings
         """
         formatted: dict[str, str] = {}
+        labels = self.field_labels()
 
-        # Get all model fields including computed fields
-        for field_name in self.__class__.model_fields.keys():
+        # Regular then computed fields, minus presentation-only ones
+        for field_name in self.rich_columns():
             value = getattr(self, field_name, None)
             if value is not None:  # Skip None values
-                # Convert field name to human-readable label
-                label = field_name.replace("_", " ").title()
-                formatted[field_name] = format_field(label, value)
-
-        # Also include computed fields
-        for field_name in self.__class__.model_computed_fields.keys():
-            if field_name in {"panel_template", "formatted_fields_dict"}:
-                continue  # Skip these special fields
-            value = getattr(self, field_name, None)
-            if value is not None:
-                label = field_name.replace("_", " ").title()
-                formatted[field_name] = format_field(label, value)
+                formatted[field_name] = format_field(labels[field_name], value)
 
         return formatted
 
@@ -301,6 +390,40 @@ class NumistaBaseModel(ABC, BaseModel):
 
         return "\n".join(lines) if lines else str(self)
 
+    @classmethod
+    def render_table(cls, items: list[Self], title: str = "") -> Table:
+        """Render items as a table with one column per regular and computed field.
+
+        Generic fallback for models without a curated ``render_table``. The
+        column schema is resolved once per model class and reused.
+
+        Parameters
+        ----------
+        items : list[Self]
+            Model instances to render as rows
+        title : str
+            Table title
+
+        Returns
+        -------
+        Table
+            Rich table with one row per item
+        """
+        names = cls.rich_columns()
+        labels = cls.field_labels()
+
+        table = Table(show_header=True, box=None, pad_edge=False, title=title)
+        for name in names:
+            table.add_column(labels[name], no_wrap=True)
+        # attrgetter fetches every column in one C-level call; it returns a bare value for one name
+        get_values = attrgetter(*names)
+        single_column = len(names) == 1
+        add_row = table.add_row
+        for item in items:
+            values = (get_values(item),) if single_column else get_values(item)
+            add_row(*["" if value is None else str(value) for value in values])
+        return table
+
     @classmethod
     def render_list(cls, items: list[Self]) -> Group | str:
         """Render list of items as Rich Group with horizontal rule separators.
@@ -7,9 +7,17 @@ Pydantic models for Numista reference catalogues.
 from typing import Self
 
 from pydantic import Field, computed_field
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
+
+_CATALOGUE_COLUMNS: tuple[Column, ...] = (
+    Column("ID", no_wrap=True),
+    Column("Code", no_wrap=True),
+    Column("Title", no_wrap=False),
+    Column("Author", no_wrap=False),
+    Column("Publisher", no_wrap=False),
+)
 
 
 class Catalogue(NumistaBaseModel):
@@ -46,12 +54,7 @@ class Catalogue(NumistaBaseModel):
         Table
             Rich table with catalogue information
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("ID", no_wrap=True)
-        table.add_column("Code", no_wrap=True)
-        table.add_column("Title", no_wrap=False)
-        table.add_column("Author", no_wrap=False)
-        table.add_column("Publisher", no_wrap=False)
+        table = list_table(title, _CATALOGUE_COLUMNS)
 
         for cat in items:
             table.add_row(
@@ -9,9 +9,17 @@ Aligns with the subset of fields required for the coinlib issuer table
 from typing import Self
 
 from pydantic import Field
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
+
+_ISSUER_COLUMNS: tuple[Column, ...] = (
+    Column("Code", no_wrap=True),
+    Column("Name", no_wrap=False),
+    Column("Level", no_wrap=True, justify="right"),
+    Column("Parent", no_wrap=False),
+    Column("Wikidata", no_wrap=True),
+)
 
 
 class Issuer(NumistaBaseModel):
@@ -85,12 +93,7 @@ class Issuer(NumistaBaseModel):
         Table
             Rich table with issuer information
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("Code", no_wrap=True)
-        table.add_column("Name", no_wrap=False)
-        table.add_column("Level", no_wrap=True, justify="right")
-        table.add_column("Parent", no_wrap=False)
-        table.add_column("Wikidata", no_wrap=True)
+        table = list_table(title, _ISSUER_COLUMNS)
 
         for issuer in items:
             table.add_row(
@@ -7,9 +7,9 @@ from datetime import date, datetime
 from typing import Any, Self
 
 from pydantic import Field, HttpUrl, computed_field, field_validator
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
 from numistalib.models.references import Reference
 
 
@@ -53,6 +53,16 @@ class Signature(NumistaBaseModel):
     signer_title: str | None = Field(None, description="Signer job title")
 
 
+_ISSUE_COLUMNS: tuple[Column, ...] = (
+    Column("ID", no_wrap=True),
+    Column("Type ID", no_wrap=True),
+    Column("Year", no_wrap=True),
+    Column("Mint", no_wrap=True),
+    Column("Mintage", no_wrap=True, justify="right"),
+    Column("Comment", no_wrap=False),
+)
+
+
 class Issue(NumistaBaseModel):
     """Coin issue (specific year/mint of a type).
 
@@ -131,13 +141,7 @@ class Issue(NumistaBaseModel):
         Table
             Rich table with issue information
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("ID", no_wrap=True)
-        table.add_column("Type ID", no_wrap=True)
-        table.add_column("Year", no_wrap=True)
-        table.add_column("Mint", no_wrap=True)
-        table.add_column("Mintage", no_wrap=True, justify="right")
-        table.add_column("Comment", no_wrap=False)
+        table = list_table(title, _ISSUE_COLUMNS)
 
         for issue in items:
             # Display year or year range
@@ -6,15 +6,25 @@ Pydantic models for Numista mint facilities.
 from typing import Self
 
 from pydantic import Field, computed_field
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
 from numistalib.models.issuer import Issuer
 
 # Constant for mints still in operation
 MINT_ACTIVE_END_YEAR = 9999
 
 
+_MINT_COLUMNS: tuple[Column, ...] = (
+    Column("Id", no_wrap=True),
+    Column("Name", no_wrap=True),
+    Column("Code", no_wrap=True),
+    Column("Place", no_wrap=True),
+    Column("Country", no_wrap=True),
+    Column("Years", no_wrap=True),
+)
+
+
 class Mint(NumistaBaseModel):
     """Mint facility information.
 
@@ -82,6 +92,17 @@ class Mint(NumistaBaseModel):
             lines.append(years)
         return "\n".join(lines)
 
+    def _table_row(self) -> tuple[str, str, str, str, str, str]:
+        """Return the cell values for this mint in render_table column order."""
+        years = ""
+        if self.start_year and self.end_year:
+            end = "present" if self.end_year == MINT_ACTIVE_END_YEAR else str(self.end_year)
+            years = f"{self.start_year}-{end}"
+        elif self.start_year:
+            years = f"{self.start_year}+"
+        country = self.country.name if self.country else (self.country_code or "")
+        return (str(self.id), self.name, self.code or "", self.place or "", country, years)
+
     @classmethod
     def render_table(cls, items: list[Self], title: str = "") -> Table:
         """Generate table for mint list.
@@ -98,29 +119,10 @@ class Mint(NumistaBaseModel):
         Table
             Rich table with mint information
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("Id", no_wrap=True)
-        table.add_column("Name", no_wrap=True)
-        table.add_column("Code", no_wrap=True)
-        table.add_column("Place", no_wrap=True)
-        table.add_column("Country", no_wrap=True)
-        table.add_column("Years", no_wrap=True)
-
-        for mint in items:
-            years = ""
-            if mint.start_year and mint.end_year:
-                end = "present" if mint.end_year == MINT_ACTIVE_END_YEAR else str(mint.end_year)
-                years = f"{mint.start_year}-{end}"
-            elif mint.start_year:
-                years = f"{mint.start_year}+"
-
-            table.add_row(
-                str(mint.id),
-                mint.name,
-                mint.code or "",
-                mint.place or "",
-                mint.country.name if mint.country else (mint.country_code or ""),
-                years
-            )
+        table = list_table(title, _MINT_COLUMNS)
+
+        add_row = table.add_row
+        for row in map(cls._table_row, items):
+            add_row(*row)
 
         return table
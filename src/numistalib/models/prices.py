@@ -7,9 +7,16 @@ Pydantic models for Numista price estimates.
 from typing import Self
 
 from pydantic import Field, computed_field
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
+
+_PRICE_COLUMNS: tuple[Column, ...] = (
+    Column("Issue ID", no_wrap=True),
+    Column("Grade", no_wrap=True),
+    Column("Currency", no_wrap=True),
+    Column("Value", no_wrap=True, justify="right"),
+)
 
 
 class Price(NumistaBaseModel):
@@ -44,11 +51,7 @@ class Price(NumistaBaseModel):
         Table
             Rich table with price information
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("Issue ID", no_wrap=True)
-        table.add_column("Grade", no_wrap=True)
-        table.add_column("Currency", no_wrap=True)
-        table.add_column("Value", no_wrap=True, justify="right")
+        table = list_table(title, _PRICE_COLUMNS)
 
         for price in items:
             table.add_row(
@@ -7,9 +7,9 @@ Pydantic models for reference catalogues and multilingual labels.
 from typing import Any, Self
 
 from pydantic import Field, HttpUrl, computed_field, model_validator
-from rich.table import Table
+from rich.table import Column, Table
 
-from numistalib.models.base import NumistaBaseModel
+from numistalib.models.base import NumistaBaseModel, list_table
 
 
 class Catalogue(NumistaBaseModel):
@@ -26,6 +26,14 @@ class Catalogue(NumistaBaseModel):
     code: str = Field(max_length=50, description="Catalogue code")
 
 
+_REFERENCE_COLUMNS: tuple[Column, ...] = (
+    Column("Catalogue", no_wrap=True),
+    Column("ID", no_wrap=True, justify="right"),
+    Column("Number", no_wrap=True),
+    Column("Url", no_wrap=False),
+)
+
+
 class Reference(NumistaBaseModel):
     """Reference catalogue information.
 
@@ -85,11 +93,7 @@ class Reference(NumistaBaseModel):
         Table
             Rich table with catalogue, number, and URL columns
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("Catalogue", no_wrap=True)
-        table.add_column("ID", no_wrap=True, justify="right")
-        table.add_column("Number", no_wrap=True)
-        table.add_column("Url", no_wrap=False)
+        table = list_table(title, _REFERENCE_COLUMNS)
 
         for ref in items:
             table.add_row(
@@ -8,13 +8,14 @@ from __future__ import annotations
 
 import re
 from abc import ABC
+from collections.abc import Iterable
+from contextlib import suppress
 from datetime import date
 from functools import cached_property
 from io import BytesIO
 from typing import Annotated, Any, Literal
 
 import httpx
-from bs4 import BeautifulSoup
 from PIL import Image as PILImage
 from pydantic import (
     AnyUrl,
@@ -26,7 +27,8 @@ from pydantic import (
     model_validator,
 )
 from pydantic_core import Url
-from rich.table import Table
+from rich.panel import Panel
+from rich.table import Column, Table
 from rich.text import Text
 
 try:
@@ -43,8 +45,60 @@ except (ImportError, OSError, RuntimeError):
             yield Text(self._placeholder)
 
 from numistalib.models import Currency, Issuer, Mint, NumistaBaseModel, Reference
+from numistalib.models.base import list_table
 from numistalib.models.issues import IssueTerms
 
+_NEWLINE = Text("\n")
+# Shared, never mutated: Text.join and _panel_body copy them into new Text objects
+_TAG_SEPARATOR = Text(" ")
+_TAGS_HEADER = Text("Tags:", style="header")
+
+
+def _panel_body(lines: Iterable[str | Text]) -> Text:
+    """Build a panel body as a single ``Text`` so Rich does not re-parse markup at render time.
+
+    Parameters
+    ----------
+    lines : Iterable[str | Text]
+        Markup strings (parsed once here) or prebuilt ``Text`` lines
+
+    Returns
+    -------
+    Text
+        Newline-joined body
+    """
+    return _NEWLINE.join(Text.from_markup(line) if isinstance(line, str) else line for line in lines)
+
+
+_EMPTY_CELL = Text("")
+_WIKIDATA_URL = "https://www.wikidata.org/wiki/"
+
+
+def _link_cell(display: str, url: str | None) -> Text:
+    """Return a table cell for ``display``, hyperlinked to ``url`` when given.
+
+    Parameters
+    ----------
+    display : str
+        Cell text, taken literally (never parsed as markup)
+    url : str | None
+        Link target, or None for plain text
+
+    Returns
+    -------
+    Text
+        Styled cell
+    """
+    return Text(display, style=f"link {url}" if url else "")
+
+
+def _url_cell(url: HttpUrl | None) -> Text:
+    """Return a table cell showing ``url`` as a link to itself (empty when missing)."""
+    if not url:
+        return _EMPTY_CELL
+    display = str(url)
+    return _link_cell(display, display)
+
 
 class Country(NumistaBaseModel):
     """Country information with code and name."""
@@ -141,6 +195,16 @@ class RulerGroup(NumistaBaseModel):
     name: str = Field(..., description="Group Name")
 
 
+_RULER_COLUMNS: tuple[Column, ...] = (
+    Column("Id", no_wrap=True),
+    Column("Name", no_wrap=True),
+    Column("Wikidata Id", no_wrap=True),
+    Column("Nomisma Id", no_wrap=True),
+    Column("Group Id", no_wrap=True),
+    Column("Group Name", no_wrap=True),
+)
+
+
 class Ruler(NumistaBaseModel):
     """Maps to Numista ruler schema for detailed ruler information."""
 
@@ -213,15 +277,8 @@ class Ruler(NumistaBaseModel):
         Table
             Rich table with ruler information
         """
-        from rich.table import Table
 
-        table = Table(show_header=True, box=None, pad_edge=False, title=title, expand=True)
-        table.add_column("Id", no_wrap=True)
-        table.add_column("Name", no_wrap=True)
-        table.add_column("Wikidata Id", no_wrap=True)
-        table.add_column("Nomisma Id", no_wrap=True)
-        table.add_column("Group Id", no_wrap=True)
-        table.add_column("Group Name", no_wrap=True)
+        table = list_table(title, _RULER_COLUMNS, expand=True)
 
         for ruler in items:
             table.add_row(
@@ -315,8 +372,10 @@ class SideBase(NumistaBaseModel, ABC):
             "picture_link",     # Redundant with picture
         }
 
+        labels = self.field_labels()
+
         # Process regular fields
-        for field_name in self.__class__.model_fields.keys():
+        for field_name in self.__class__.model_fields:
             if field_name in exclude_fields:
                 continue
 
@@ -324,35 +383,26 @@ class SideBase(NumistaBaseModel, ABC):
             if value is None:
                 continue
 
-            label = field_name.replace("_", " ").title()
-
-            # Format lists specially
+            # Format lists specially: models by name, anything else by str (generators, no temp lists)
             if isinstance(value, list):
                 if not value:
                     continue
-                # Check if it's a list of models
-                if all(hasattr(item, "__class__") and hasattr(item.__class__, "__name__") for item in value):
-                    # List of objects - extract names
-                    if hasattr(value[0], "name"):
-                        formatted_value = ", ".join(str(item.name) for item in value)
-                    else:
-                        formatted_value = ", ".join(str(item) for item in value)
+                if hasattr(value[0], "name"):
+                    formatted_value = ", ".join(str(item.name) for item in value)
                 else:
-                    # Simple list
-                    formatted_value = ", ".join(str(item) for item in value)
-                formatted.append(format_field(label, formatted_value))
+                    formatted_value = ", ".join(map(str, value))
+                formatted.append(format_field(labels[field_name], formatted_value))
             else:
-                formatted.append(format_field(label, value))
+                formatted.append(format_field(labels[field_name], value))
 
         # Process computed fields (excluding those in exclude set)
-        for field_name in self.__class__.model_computed_fields.keys():
+        for field_name in self.__class__.model_computed_fields:
             if field_name in exclude_fields or field_name == "formatted_fields":
                 continue
 
             value = getattr(self, field_name, None)
             if value is not None:
-                label = field_name.replace("_", " ").title()
-                formatted.append(format_field(label, value))
+                formatted.append(format_field(labels[field_name], value))
 
         return formatted
 
@@ -455,18 +505,18 @@ class Printer(NumistaBaseModel):
 
 class TypeBase(NumistaBaseModel, ABC):
     """Common fields shared between basic and full type representations."""
-    numista_id: int = Field(alias="id", gt=0, description="Numista ID")
+    numista_id: int = Field(alias="id", gt=0, description="Numista ID", json_schema_extra={"rich_width": 10})
     title: Annotated[str, StringConstraints(strip_whitespace=True, max_length=500)] = Field(
         ..., description="Type title"
     )
 
     category: Literal["coin", "banknote", "exonumia"] = Field(
-        ..., description="Category: coin, banknote, exonumia"
+        ..., description="Category: coin, banknote, exonumia", json_schema_extra={"rich_width": 8}
     )
     min_year: int | None = Field(None, ge=-9999, le=9999, description="First year of production")  # Allow BC dates
     max_year: int | None = Field(None, ge=-9999, le=9999, description="Last year of production")
 
-    @computed_field(description="Human-readable year range")
+    @computed_field(description="Human-readable year range", json_schema_extra={"rich_width": 10})
     def year_range(self) -> str:
         """Get human-readable year range."""
         if self.min_year and self.max_year:
@@ -493,6 +543,19 @@ class TypeBase(NumistaBaseModel, ABC):
         return self
 
 
+_TYPE_BASIC_COLUMNS: tuple[Column, ...] = (
+    Column("Numista ID", no_wrap=True),
+    Column("Type title", no_wrap=False),
+    Column("Category", no_wrap=True),
+    Column("First year", no_wrap=True),
+    Column("Last year", no_wrap=True),
+    Column("Issuer", no_wrap=False),
+    Column("Country", no_wrap=False),
+    Column("Obverse thumb URL", no_wrap=False, overflow="fold"),
+    Column("Reverse thumb URL", no_wrap=False, overflow="fold"),
+)
+
+
 class TypeBasic(TypeBase):
     """Basic type information from search results."""
 
@@ -531,19 +594,21 @@ class TypeBasic(TypeBase):
         # Use formatted_fields for consistent DRY formatting
         text_block = "\n".join(self.formatted_fields)
 
-        # Try to render thumbnail
+        thumb = self.renderable_thumbnail
+        return Group(thumb, text_block) if thumb else text_block
+
+    @cached_property
+    def renderable_thumbnail(self) -> Any | None:
+        """Ready-to-print obverse thumbnail, downloaded once; None when missing or unavailable."""
+        if self.obverse_thumbnail is None:
+            return None
         try:
-            if self.obverse_thumbnail is not None:
-                response = httpx.get(str(self.obverse_thumbnail), follow_redirects=True, timeout=10.0)
-                response.raise_for_status()
-                image = PILImage.open(BytesIO(response.content))
-                thumb = TImage(image)
-                return Group(thumb, text_block)
+            response = httpx.get(str(self.obverse_thumbnail), follow_redirects=True, timeout=10.0)
+            response.raise_for_status()
+            return TImage(PILImage.open(BytesIO(response.content)))
         except Exception:
             # Fallback to text only
-            pass
-
-        return text_block
+            return None
 
     @classmethod
     def render_table(cls, items: list[TypeBasic], title: str = "") -> Table:
@@ -554,51 +619,45 @@ class TypeBasic(TypeBase):
         Obverse thumb URL, Reverse thumb URL.
         Issuer is rendered as a short name (link when possible).
         """
-        table = Table(show_header=True, box=None, pad_edge=False, title=title)
-        table.add_column("Numista ID", no_wrap=True)
-        table.add_column("Type title", no_wrap=False)
-        table.add_column("Category", no_wrap=True)
-        table.add_column("First year", no_wrap=True)
-        table.add_column("Last year", no_wrap=True)
-        table.add_column("Issuer", no_wrap=False)
-        table.add_column("Country", no_wrap=False)
-        table.add_column("Obverse thumb URL", no_wrap=False, overflow="fold")
-        table.add_column("Reverse thumb URL", no_wrap=False, overflow="fold")
+        table = list_table(title, _TYPE_BASIC_COLUMNS)
 
+        # Cells are prebuilt Text objects, so Rich never runs its markup parser per cell
+        add_row = table.add_row
         for t in items:
-            # Issuer display: prefer name; add link when available
-            issuer_text = ""
+            issuer_text = _EMPTY_CELL
             if t.issuer:
                 name = getattr(t.issuer, "name", None) or ""
                 # Use Wikidata link if present as a safe external reference
                 wikidata_id = getattr(t.issuer, "wikidata_id", None)
-                if wikidata_id:
-                    issuer_text = f"[link=https://www.wikidata.org/wiki/{wikidata_id}]{name}[/link]"
-                else:
-                    issuer_text = name
-
-            def _link_cell(url: HttpUrl | None) -> Text:
-                if not url:
-                    return Text("")
-                display = str(url)
-                cell = Text(display)
-                cell.stylize(f"link {display}", 0, len(display))
-                return cell
-
-            table.add_row(
-                str(t.numista_id),
-                t.title,
-                t.category,
-                str(t.min_year) if t.min_year is not None else "",
-                str(t.max_year) if t.max_year is not None else "",
+                issuer_text = _link_cell(name, f"{_WIKIDATA_URL}{wikidata_id}" if wikidata_id else None)
+
+            country = getattr(t, "country", None)
+            add_row(
+                Text(str(t.numista_id)),
+                Text(t.title),
+                Text(t.category),
+                Text(str(t.min_year)) if t.min_year is not None else _EMPTY_CELL,
+                Text(str(t.max_year)) if t.max_year is not None else _EMPTY_CELL,
                 issuer_text,
-                (t.country.name if getattr(t, "country", None) and getattr(t.country, "name", None) else ""),
-                _link_cell(t.obverse_thumbnail),
-                _link_cell(t.reverse_thumbnail),
+                Text(country.name) if country and getattr(country, "name", None) else _EMPTY_CELL,
+                _url_cell(t.obverse_thumbnail),
+                _url_cell(t.reverse_thumbnail),
             )
 
         return table
 
+    def plain_cells(self) -> tuple[str, str, str, str, str]:
+        """Return the plain-text summary cells (no Rich markup).
+
+        Columns: Numista ID, title, category, year range, issuer name.
+        """
+        issuer_name = self.issuer.name if self.issuer else ""
+        return (str(self.numista_id), self.title, self.category, self.year_range, issuer_name)
+
+    def render_plain(self) -> str:
+        """Render :meth:`plain_cells` as a single tab-separated line."""
+        return "\t".join(self.plain_cells())
+
     def to_dict(self) -> dict[str, object]:
         """Return a compact dict representation used by tests."""
         return {
@@ -768,6 +827,8 @@ class TypeFull(TypeBase):
 
         # Check if value contains HTML
         if "<" in text and ">" in text:
+            from bs4 import BeautifulSoup  # deferred: only needed for HTML comments
+
             soup = BeautifulSoup(text, "html.parser")
 
             # First pass: Replace image links with inline marker before text extraction
@@ -825,6 +886,34 @@ class TypeFull(TypeBase):
 
         return text.strip() if text else None
 
+    def prefetch_thumbnails(self, max_workers: int = 8) -> None:
+        """Download every thumbnail :meth:`render_detail` shows, concurrently.
+
+        Rendering otherwise fetches the edge, obverse, reverse and related-type
+        thumbnails one after another; warming their cached properties in a
+        thread pool first cuts the wait to roughly the slowest download.
+        Failed downloads are left for rendering to handle as before.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum concurrent downloads (default 8)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        sources: list[Edge | SideBase | TypeBasic] = [side for side in (self.edge, self.obverse, self.reverse) if side]
+        sources.extend(self.related_types or ())
+        if not sources:
+            return
+
+        def warm(source: Edge | SideBase | TypeBasic) -> None:
+            with suppress(Exception):
+                _ = source.renderable_thumbnail
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as pool:
+            for _ in pool.map(warm, sources):
+                pass
+
     def render_detail(self, cache_indicator: str = "") -> Any:
         """Render detailed type information using theme-aware, vertical scrolling layout.
 
@@ -846,10 +935,12 @@ class TypeFull(TypeBase):
         from numistalib.models.mints import Mint
         from numistalib.models.references import Reference
 
+        fields = self.formatted_fields_dict
+
         # General panel - filter out None values
-        general_lines = []
+        general_lines: list[str | Text] = []
         for key in ["numista_id", "numista_url", "title", "series", "category", "year_range"]:
-            field = self.formatted_fields_dict.get(key)
+            field = fields.get(key)
             if field:
                 general_lines.append(field)
 
@@ -858,123 +949,105 @@ class TypeFull(TypeBase):
             if demonetized:
                 general_lines.append(demonetized)
 
-        commemorated = self.formatted_fields_dict.get("commemorated_topic")
+        commemorated = fields.get("commemorated_topic")
         if commemorated:
             general_lines.append(commemorated)
 
         if self.tags:
-            general_lines.append("[header]Tags:[/header]")
-            general_lines.append(" ".join([f"[inverse]{g}[/inverse]" for g in self.tags]))
+            general_lines.append(_TAGS_HEADER)
+            general_lines.append(_TAG_SEPARATOR.join(Text(tag, style="inverse") for tag in self.tags))
 
-        general_panel = CLISettings.panel(
-            title=f"{cache_indicator} Type Details",
-            content="\n".join(general_lines)
-        )
+        # Only populated panels are built; absent sections cost nothing to render
+        panels: list[Panel] = [
+            CLISettings.panel(title=f"{cache_indicator} Type Details", content=_panel_body(general_lines))
+        ]
 
         # Value panel - filter out None values
-        value_lines = []
+        value_lines: list[str | Text] = []
         if self.value:
+            value_fields = self.value.formatted_fields_dict
             for key in ["text", "numeric_value", "numerator", "denominator"]:
-                field = self.value.formatted_fields_dict.get(key)
+                field = value_fields.get(key)
                 if field:
                     value_lines.append(field)
 
             if self.value.currency:
-                value_lines.append("[header]Currency:[/header]")
+                value_lines.append(Text("Currency:", style="header"))
+                currency_fields = self.value.currency.formatted_fields_dict
                 for key in ["name", "full_name", "symbol", "numista_id"]:
-                    field = self.value.currency.formatted_fields_dict.get(key)
+                    field = currency_fields.get(key)
                     if field:
                         value_lines.append(field)
 
-        value_panel = CLISettings.panel(
-            title="Value",
-            content="\n".join(value_lines) if value_lines else ""
-        )
+        if value_lines:
+            panels.append(CLISettings.panel(title="Value", content=_panel_body(value_lines)))
 
         # Issuer panel - filter out None values
-        issuer_lines = []
+        issuer_lines: list[str | Text] = []
         for key in ["issuing_entity", "issue_terms"]:
-            field = self.formatted_fields_dict.get(key)
+            field = fields.get(key)
             if field:
                 issuer_lines.append(field)
 
         if self.issuer:
+            issuer_fields = self.issuer.formatted_fields_dict
             for key in ["code", "name"]:
-                field = self.issuer.formatted_fields_dict.get(key)
+                field = issuer_fields.get(key)
                 if field:
                     issuer_lines.append(field)
 
-        issuer_panel = CLISettings.panel(
-            title="Issuer",
-            content="\n".join(issuer_lines) if issuer_lines else ""
-        )
+        if issuer_lines:
+            panels.append(CLISettings.panel(title="Issuer", content=_panel_body(issuer_lines)))
 
-        mints_panel = CLISettings.panel(
-            title="Mints",
-            content=Mint.render_table(self.mints, title="") if self.mints else ""
-        )
+        if self.mints:
+            panels.append(CLISettings.panel(title="Mints", content=Mint.render_table(self.mints, title="")))
 
         # Physical specifications panel - filter out None values
-        specs_lines = []
+        specs_lines: list[str | Text] = []
         for key in ["orientation", "shape", "size", "thickness"]:
-            field = self.formatted_fields_dict.get(key)
+            field = fields.get(key)
             if field:
                 specs_lines.append(field)
 
         if self.composition:
-            specs_lines.append("[header]Composition:[/header]")
+            specs_lines.append(Text("Composition:", style="header"))
             comp_text = self.composition.formatted_fields_dict.get("text")
             if comp_text:
                 specs_lines.append(comp_text)
 
-        specs_panel = CLISettings.panel(
-            title="Physical Specifications",
-            content="\n".join(specs_lines) if specs_lines else ""
-        )
-
-        edge_panel = CLISettings.panel(
-            title="Edge Specifications",
-            content=Group(
-                "\n".join(list(self.edge.formatted_fields)) if self.edge else "",
-                self.edge.renderable_thumbnail if self.edge and self.edge.renderable_thumbnail else ""
-            ) if self.edge else ""
-        )
-
-        obverse_panel = CLISettings.panel(
-            title="Obverse Specifications",
-            content=Group(
-                "\n".join(list(self.obverse.formatted_fields)),
-                self.obverse.renderable_thumbnail if self.obverse.renderable_thumbnail else ""
-            )
-        )
-
-        reverse_panel = CLISettings.panel(
-            title="Reverse Specifications",
-            content=Group(
-                "\n".join(list(self.reverse.formatted_fields)),
-                self.reverse.renderable_thumbnail if self.reverse.renderable_thumbnail else ""
+        if specs_lines:
+            panels.append(CLISettings.panel(title="Physical Specifications", content=_panel_body(specs_lines)))
+
+        def side_body(side: Edge | SideBase) -> Text | Group:
+            # Only wrap in a Group when there is a thumbnail to stack under the fields
+            body = _panel_body(side.formatted_fields)
+            thumbnail = side.renderable_thumbnail
+            return Group(body, thumbnail) if thumbnail else body
+
+        for title, side in (
+            ("Edge Specifications", self.edge),
+            ("Obverse Specifications", self.obverse),
+            ("Reverse Specifications", self.reverse),
+        ):
+            if side:
+                panels.append(CLISettings.panel(title=title, content=side_body(side)))
+
+        if self.rulers:
+            panels.append(CLISettings.panel(title="Rulers", content=Ruler.render_table(self.rulers, title="")))
+
+        if self.references:
+            panels.append(
+                CLISettings.panel(title="References", content=Reference.render_table(self.references, title=""))
             )
-        )
-
-        rulers_panel = CLISettings.panel(
-            title="Rulers",
-            content=Ruler.render_table(self.rulers, title="") if self.rulers else ""
-        )
-
-        references_panel = CLISettings.panel(
-            title="References",
-            content=Reference.render_table(self.references, title="") if self.references else ""
-        )
 
         # Related types panel - use list rendering with thumbnails
-        related_types_panel = CLISettings.panel(
-            title="Related Types",
-            content=TypeBasic.render_list(self.related_types) if self.related_types else ""
-        )
+        if self.related_types:
+            panels.append(
+                CLISettings.panel(title="Related Types", content=TypeBasic.render_list(self.related_types))
+            )
 
         # Comments panel - promote label to title (single field)
         # Pre-wrap text to panel width to avoid mid-word breaks
-        comments_text = ""
         if self.comments_rendered:
             # Wrap each line to panel width - 4 (for panel borders/padding)
             wrapped_lines = []
@@ -985,24 +1058,6 @@ class TypeFull(TypeBase):
                     wrapped_lines.append(wrapped)
                 else:
                     wrapped_lines.append(line)
-            comments_text = "\n".join(wrapped_lines)
-
-        comments_panel = CLISettings.panel(
-            title="Comments",
-            content=comments_text
-        )
-
-        return (
-            general_panel,
-            value_panel,
-            issuer_panel,
-            mints_panel,
-            specs_panel,
-            edge_panel,
-            obverse_panel,
-            reverse_panel,
-            rulers_panel,
-            references_panel,
-            related_types_panel,
-            comments_panel,
-        )
+            panels.append(CLISettings.panel(title="Comments", content=Text.from_markup("\n".join(wrapped_lines))))
+
+        return tuple(panels)
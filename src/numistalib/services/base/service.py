@@ -1,5 +1,6 @@
 """Abstract base classes for Numista services."""
 
+import logging
 import sys
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine, Mapping
@@ -211,7 +212,8 @@ class BaseService(ABC):
     ) -> NoReturn:
         """Handle CLI errors with consistent logging and user-friendly display.
 
-        Logs full traceback to module logger for debugging, displays friendly
+        Logs the error to the module logger (with the full traceback only when
+        DEBUG logging is enabled), displays friendly
         error message to user via Rich error console, then exits with code 1.
 
         Parameters
@@ -230,16 +232,18 @@ class BaseService(ABC):
         ... except (RuntimeError, OSError, ValueError) as e:
         ...     service._handle_cli_error(e, "listing catalogues", "cat-list")
         """
-        # Log full traceback for debugging
-        logger.exception(
-            f"Error in {context} (command: {command}): {err}",
-            exc_info=err,
+        # Lazy %-formatting; the traceback is only captured when it will be emitted
+        logger.error(
+            "Error in %s (command: %s): %s",
+            context,
+            command,
+            err,
+            exc_info=err if logger.isEnabledFor(logging.DEBUG) else None,
         )
 
         # Display friendly message to user
         from numistalib.cli.theme import CLISettings
-        console = CLISettings.console()
-        console.print(f"[danger]Error in {context}: {err}[/danger]")
+        CLISettings.print_error(f"Error in {context}: {err}")
 
         # Exit with error code
         sys.exit(1)
@@ -8,6 +8,21 @@ from numistalib.client import AsyncClientProtocol, NumistaResponse, SyncClientPr
 from numistalib.models.collections import CollectedItem, GradingDetails, Picture, TypeDetail, UserCollection
 from numistalib.services.collections.base import CollectionServiceBase
 
+# CollectedItem fields copied from the API payload unchanged (missing keys become None)
+_PASSTHROUGH_FIELDS: tuple[str, ...] = (
+    "grade",
+    "private_comment",
+    "public_comment",
+    "storage_location",
+    "acquisition_place",
+    "acquisition_date",
+    "serial_number",
+    "internal_id",
+    "weight",
+    "size",
+    "axis",
+)
+
 
 class CollectionService(CollectionServiceBase):
     """Unified collection service supporting both sync and async clients.
@@ -46,56 +61,22 @@ class CollectionService(CollectionServiceBase):
         """
         collected_items: list[CollectedItem] = []
         for item in items:
-            type_dict = cast(Mapping[str, Any], item["type"])
-            type_obj = TypeDetail(**type_dict)
-
-            issue_obj = None
-            if item.get("issue"):
-                issue_obj = cast(dict[str, object], item["issue"])
-
-            price_obj = None
-            if item.get("price"):
-                price_obj = cast(dict[str, object], item["price"])
-
-            collection_obj = None
-            if item.get("collection"):
-                collection_dict = cast(Mapping[str, Any], item["collection"])
-                collection_obj = UserCollection(**collection_dict)
-
-            pictures_obj = None
-            if item.get("pictures"):
-                pictures_list = cast(list[Mapping[str, Any]], item["pictures"])
-                pictures_obj = [Picture(**pic) for pic in pictures_list]
-
-            grading_obj = None
-            if item.get("grading_details"):
-                grading_dict = cast(Mapping[str, Any], item["grading_details"])
-                grading_obj = GradingDetails(**grading_dict)
-
-            grade_val = cast(str | None, item.get("grade"))
+            collection = item.get("collection")
+            pictures = item.get("pictures")
+            grading_details = item.get("grading_details")
 
             collected_items.append(
                 CollectedItem(
-                    id=cast(int, item["id"]),
-                    quantity=cast(int, item.get("quantity", 1)),
-                    type=type_obj,
+                    id=item["id"],
+                    quantity=item.get("quantity", 1),
+                    type=TypeDetail(**item["type"]),
                     for_swap=bool(item.get("for_swap", False)),
-                    issue=issue_obj,
-                    grade=grade_val,  # type: ignore[arg-type]
-                    private_comment=cast(str | None, item.get("private_comment")),
-                    public_comment=cast(str | None, item.get("public_comment")),
-                    price=price_obj,
-                    collection=collection_obj,
-                    pictures=pictures_obj,
-                    storage_location=cast(str | None, item.get("storage_location")),
-                    acquisition_place=cast(str | None, item.get("acquisition_place")),
-                    acquisition_date=cast(Any, item.get("acquisition_date")),  # type: ignore[arg-type]
-                    serial_number=cast(str | None, item.get("serial_number")),
-                    internal_id=cast(str | None, item.get("internal_id")),
-                    weight=cast(float | None, item.get("weight")),
-                    size=cast(float | None, item.get("size")),
-                    axis=cast(int | None, item.get("axis")),
-                    grading_details=grading_obj,
+                    issue=item.get("issue") or None,
+                    price=item.get("price") or None,
+                    collection=UserCollection(**collection) if collection else None,
+                    pictures=[Picture(**pic) for pic in pictures] if pictures else None,
+                    grading_details=GradingDetails(**grading_details) if grading_details else None,
+                    **{field: item.get(field) for field in _PASSTHROUGH_FIELDS},
                 )
             )
         return collected_items
@@ -8,7 +8,7 @@ from numistalib.models.types import TypeBasic, TypeFull
 from numistalib.services.base import BaseService
 
 if TYPE_CHECKING:
-    from numistalib.services.types.service import SearchParams
+    from numistalib.services.types.service import SearchParams, TypePagedResponse
 
 
 class TypeBasicServiceBase(BaseService):
@@ -32,6 +32,29 @@ class TypeBasicServiceBase(BaseService):
         ...
         yield  # type: ignore[misc]
 
+    @abstractmethod
+    async def paginated_search_pages(self, params: "SearchParams") -> AsyncGenerator[list[TypeBasic]]:
+        """Lazily search catalogue types, yielding one list per page (async)."""
+        ...
+        yield  # type: ignore[misc]
+
+    @abstractmethod
+    async def get_page(self, page: int, params: "SearchParams") -> "TypePagedResponse":
+        """Fetch one page of type search results (async)."""
+        pass
+
+    @abstractmethod
+    async def paginated_search_pages_parallel(
+        self,
+        params: "SearchParams",
+        *,
+        max_results: int | None = None,
+        concurrency: int = 4,
+    ) -> AsyncGenerator[list[TypeBasic]]:
+        """Lazily search catalogue types fetching several pages concurrently (async)."""
+        ...
+        yield  # type: ignore[misc]
+
     @abstractmethod
     async def search_types_paginated(
         self,
@@ -45,6 +68,22 @@ class TypeBasicServiceBase(BaseService):
         ...
         yield  # type: ignore[misc]
 
+    @abstractmethod
+    async def search_types_paginated_pages(
+        self,
+        query: str | None = None,
+        issuer: str | None = None,
+        year: int | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        *,
+        max_results: int | None = None,
+        concurrency: int = 1,
+    ) -> AsyncGenerator[list[TypeBasic]]:
+        """Convenience wrapper for page-at-a-time type search (async)."""
+        ...
+        yield  # type: ignore[misc]
+
 
 class TypeFullServiceBase(BaseService):
     """Abstract interface for type detail and mutation operations."""
@@ -1,10 +1,11 @@
 """Type service implementation."""
 
+import asyncio
 from collections.abc import AsyncGenerator, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from numistalib import logger
 from numistalib.client import AsyncClientProtocol, NumistaResponse, SyncClientProtocol
@@ -15,6 +16,11 @@ from numistalib.services.types.base import (
     TypeServiceBase,
 )
 
+# Built once per process; validating a whole page through one adapter call
+# keeps the per-item loop inside pydantic-core
+TYPE_BASIC_LIST_ADAPTER: TypeAdapter[list[TypeBasic]] = TypeAdapter(list[TypeBasic])
+TYPE_FULL_ADAPTER: TypeAdapter[TypeFull] = TypeAdapter(TypeFull)
+
 
 @dataclass
 class SearchParams:
@@ -28,6 +34,11 @@ class SearchParams:
     page: int = 1
     count: int = 100
 
+    @property
+    def page_size(self) -> int:
+        """Results requested per page (``count``, capped at the API maximum of 100)."""
+        return min(self.count, 100)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to API parameter dictionary.
 
@@ -38,7 +49,7 @@ class SearchParams:
         """
         params: dict[str, Any] = {
             "lang": self.lang,
-            "count": min(self.count, 100),
+            "count": self.page_size,
         }
         if self.page > 1:
             params["page"] = self.page
@@ -64,12 +75,24 @@ class SearchParams:
 
 
 class TypePagedResponse(BaseModel):
-    """Pagination response wrapper for types search."""
+    """Pagination response wrapper for types search.
+
+    Validated straight from the response bytes with ``model_validate_json``
+    so the envelope and every ``TypeBasic`` are parsed in one pydantic-core pass.
+    """
 
-    types: list[dict[str, Any]]
+    count: int | None = None
+    types: list[TypeBasic] = []
     next_url: str | None = None
 
 
+def _last_page_needed(total: int, per_page: int, max_results: int | None) -> int:
+    """Return the last page number needed to cover ``total`` results, capped at ``max_results``."""
+    if max_results is not None:
+        total = min(total, max_results)
+    return -(-total // per_page)
+
+
 class TypeBasicService(TypeBasicServiceBase):
     """Type search service returning TypeBasic models."""
 
@@ -91,7 +114,7 @@ class TypeBasicService(TypeBasicServiceBase):
         list[TypeBasic]
             Validated TypeBasic models
         """
-        return [TypeBasic.model_validate(item) for item in items]
+        return TYPE_BASIC_LIST_ADAPTER.validate_python(items)
 
     def search_types(self, params: SearchParams) -> list[TypeBasic]:
         """Search the type catalogue with the given parameters.
@@ -125,9 +148,7 @@ class TypeBasicService(TypeBasicServiceBase):
         )
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        types_list = [TypeBasic.model_validate(item) for item in data.get("types", [])]
+        types_list = TypePagedResponse.model_validate_json(response.content).types
 
         logger.info(
             f"Retrieved {len(types_list)} types page {params.page} {response.cached_indicator}"
@@ -164,9 +185,7 @@ class TypeBasicService(TypeBasicServiceBase):
         response = await self._aget("/types", params=params.to_dict())
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        types_list = [TypeBasic.model_validate(item) for item in data.get("types", [])]
+        types_list = TypePagedResponse.model_validate_json(response.content).types
 
         logger.info(
             f"Retrieved {len(types_list)} types page {params.page} {response.cached_indicator}"
@@ -186,8 +205,28 @@ class TypeBasicService(TypeBasicServiceBase):
         TypeBasic
             Individual type models from paginated responses
         """
+        async for page in self.paginated_search_pages(params):
+            for type_item in page:
+                yield type_item
+
+    async def paginated_search_pages(self, params: SearchParams) -> AsyncGenerator[list[TypeBasic]]:
+        """Search the type catalogue and yield one validated list per response page.
+
+        Lets consumers that buffer results ``extend`` a whole page at once
+        instead of resuming the generator for every item.
+
+        Parameters
+        ----------
+        params : SearchParams
+            Search parameters (query, issuer, year, category)
+
+        Yields
+        ------
+        list[TypeBasic]
+            Type models from one paginated response
+        """
         logger.debug(
-            "→ paginated_search(query=%s, issuer=%s, year=%s, category=%s)",
+            "→ paginated_search_pages(query=%s, issuer=%s, year=%s, category=%s)",
             params.query,
             params.issuer,
             params.year,
@@ -199,30 +238,119 @@ class TypeBasicService(TypeBasicServiceBase):
                 "At least one search parameter (q, issuer, year, category) required"
             ) from None
 
-        page_num = 1
-        while True:
-            params.page = page_num
-            logger.debug(f"Fetching types page {page_num}")
+        first = await self.get_page(1, params)
+        if first.types:
+            yield first.types
+            async for types_list in self._follow_next_pages(first, params):
+                yield types_list
+
+    async def _follow_next_pages(
+        self, first: TypePagedResponse, params: SearchParams
+    ) -> AsyncGenerator[list[TypeBasic]]:
+        """Yield the pages after ``first`` one at a time while the API reports a ``next_url``."""
+        page_num, page = 1, first
+        while page.next_url:
+            page_num += 1
+            page = await self.get_page(page_num, params)
+            if not page.types:
+                break
+            yield page.types
 
-            response = await self._aget("/types", params=params.to_dict())
-            response.raise_for_status()
-            self._track_response(response)
-            data = cast(Mapping[str, Any], response.json())
+        logger.info(f"Finished paginating {page_num} pages of type results")
 
-            types_list = [TypeBasic.model_validate(item) for item in data.get("types", [])]
+    async def paginated_search_pages_parallel(
+        self,
+        params: SearchParams,
+        *,
+        max_results: int | None = None,
+        concurrency: int = 4,
+    ) -> AsyncGenerator[list[TypeBasic]]:
+        """Search the type catalogue fetching up to ``concurrency`` pages at once.
+
+        The first page is fetched alone to learn the total ``count``; the
+        remaining pages are then requested concurrently and yielded in page
+        order as each one completes. Requests still pass through the client's
+        rate limiter.
 
-            if not types_list:
-                break
+        Parameters
+        ----------
+        params : SearchParams
+            Search parameters (query, issuer, year, category)
+        max_results : int | None, optional
+            Do not request pages beyond this many results, by default None (all)
+        concurrency : int, optional
+            Maximum page requests in flight, by default 4
 
-            for type_item in types_list:
-                yield type_item
+        Yields
+        ------
+        list[TypeBasic]
+            Type models from one response page, in page order
+        """
+        if not params.has_search_criteria():
+            raise ValueError(
+                "At least one search parameter (q, issuer, year, category) required"
+            ) from None
 
-            if not data.get("next_url"):
-                break
+        first = await self.get_page(1, params)
+        if not first.types:
+            return
+        yield first.types
+
+        if first.count is None:
+            # Total unknown, so later page numbers cannot be planned: follow next_url sequentially
+            async for types_list in self._follow_next_pages(first, params):
+                yield types_list
+            return
+
+        # Plan from the requested page size: a short first page must not inflate the page count
+        last_page = _last_page_needed(first.count, params.page_size, max_results)
+        if last_page <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_num: int) -> TypePagedResponse:
+            async with semaphore:
+                return await self.get_page(page_num, params)
+
+        tasks = [asyncio.create_task(fetch(page_num)) for page_num in range(2, last_page + 1)]
+        try:
+            for task in tasks:
+                page = await task
+                if not page.types:
+                    break
+                yield page.types
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations to land so no page request outlives the generator
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(f"Finished fetching {last_page} pages of type results ({concurrency} concurrent)")
+
+    async def get_page(self, page: int, params: SearchParams) -> TypePagedResponse:
+        """Fetch and validate one page of type search results.
+
+        Pages are independent, so callers may await several of these
+        concurrently; ``params`` is not modified.
 
-            page_num += 1
+        Parameters
+        ----------
+        page : int
+            1-based page number
+        params : SearchParams
+            Search parameters (query, issuer, year, category, count)
 
-        logger.info(f"Finished paginating {page_num} pages of type results")
+        Returns
+        -------
+        TypePagedResponse
+            Validated page envelope, including the total ``count`` when the API reports it
+        """
+        logger.debug(f"Fetching types page {page}")
+        response = await self._aget("/types", params=replace(params, page=page).to_dict())
+        response.raise_for_status()
+        self._track_response(response)
+        return TypePagedResponse.model_validate_json(response.content)
 
     async def search_types_paginated(
         self,
@@ -255,6 +383,49 @@ class TypeBasicService(TypeBasicServiceBase):
         TypeBasic
             Individual type models
         """
+        async for page in self.search_types_paginated_pages(query, issuer, year, category, limit, lang):
+            for type_item in page:
+                yield type_item
+
+    async def search_types_paginated_pages(
+        self,
+        query: str | None = None,
+        issuer: str | None = None,
+        year: int | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        lang: str = "en",
+        *,
+        max_results: int | None = None,
+        concurrency: int = 1,
+    ) -> AsyncGenerator[list[TypeBasic]]:
+        """Search the type catalogue and yield one list of results per page.
+
+        Parameters
+        ----------
+        query : str | None
+            Full-text search query
+        issuer : str | None
+            Issuer code to filter by
+        year : int | None
+            Year to filter by
+        category : str | None
+            Category to filter by (coin, banknote, exonumia)
+        limit : int
+            Maximum results per page (default 50)
+        lang : str
+            Language code (default 'en')
+        max_results : int | None
+            Stop requesting pages beyond this many results (parallel mode only)
+        concurrency : int
+            Page requests in flight; values above 1 use
+            :meth:`paginated_search_pages_parallel` (default 1, sequential)
+
+        Yields
+        ------
+        list[TypeBasic]
+            Type models from one response page
+        """
         params = SearchParams(
             query=query,
             issuer=issuer,
@@ -263,8 +434,13 @@ class TypeBasicService(TypeBasicServiceBase):
             count=min(limit, 100),
             lang=lang,
         )
-        async for type_item in self.paginated_search(params=params):
-            yield type_item
+        pages = (
+            self.paginated_search_pages_parallel(params, max_results=max_results, concurrency=concurrency)
+            if concurrency > 1
+            else self.paginated_search_pages(params=params)
+        )
+        async for page in pages:
+            yield page
 
 
 class TypeFullService(TypeFullServiceBase):
@@ -311,9 +487,8 @@ class TypeFullService(TypeFullServiceBase):
         response = cast(NumistaResponse, self._client.get(f"/types/{type_id}", params=params))
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        type_full = TypeFull.model_validate(data)
+        # Parse and validate in one pydantic-core pass instead of json() + model_validate
+        type_full = TYPE_FULL_ADAPTER.validate_json(response.content)
 
         logger.info(f"Retrieved type {type_id}: {type_full.title} {response.cached_indicator}")
         return type_full
@@ -339,9 +514,8 @@ class TypeFullService(TypeFullServiceBase):
         response = await self._aget(f"/types/{type_id}", params=params)
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        type_full = TypeFull.model_validate(data)
+        # Parse and validate in one pydantic-core pass instead of json() + model_validate
+        type_full = TYPE_FULL_ADAPTER.validate_json(response.content)
 
         logger.info(f"Retrieved type {type_id}: {type_full.title} {response.cached_indicator}")
         return type_full
@@ -367,9 +541,7 @@ class TypeFullService(TypeFullServiceBase):
         response = cast(NumistaResponse, self._client.post("/types", params=params, json=type_data))
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        type_obj = TypeFull.model_validate(data)
+        type_obj = TYPE_FULL_ADAPTER.validate_json(response.content)
 
         logger.info(f"Added type {type_obj.numista_id} {response.cached_indicator}")
         return type_obj
@@ -395,9 +567,7 @@ class TypeFullService(TypeFullServiceBase):
         response = await self._apost("/types", params=params, json=type_data)
         response.raise_for_status()
         self._track_response(response)
-        data = cast(Mapping[str, Any], response.json())
-
-        type_obj = TypeFull.model_validate(data)
+        type_obj = TYPE_FULL_ADAPTER.validate_json(response.content)
 
         logger.info(f"Added type {type_obj.numista_id} {response.cached_indicator}")
         return type_obj
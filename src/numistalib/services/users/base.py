@@ -55,6 +55,7 @@ class UserServiceBase(EntityService):
         category: str | None = None,
         type_id: int | None = None,
         collection_id: int | None = None,
+        limit: int | None = None,
     ) -> list[CollectedItem]:
         """Get collected items for a user.
 
@@ -68,6 +69,8 @@ class UserServiceBase(EntityService):
             Filter by type ID
         collection_id : int | None
             Filter by collection ID
+        limit : int | None
+            Maximum number of items to return; items past it are never validated
 
         Returns
         -------
@@ -115,6 +118,7 @@ class UserServiceBase(EntityService):
         category: str | None = None,
         type_id: int | None = None,
         collection_id: int | None = None,
+        limit: int | None = None,
     ) -> list[CollectedItem]:
         """Get collected items for a user (async).
 
@@ -128,6 +132,8 @@ class UserServiceBase(EntityService):
             Filter by type ID
         collection_id : int | None
             Filter by collection ID
+        limit : int | None
+            Maximum number of items to return; items past it are never validated
 
         Returns
         -------
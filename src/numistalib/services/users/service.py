@@ -1,6 +1,7 @@
 """User service implementation."""
 
 from collections.abc import Mapping
+from itertools import islice
 from typing import Any, cast
 
 from numistalib import logger
@@ -112,6 +113,7 @@ class UserService(UserServiceBase):
         category: str | None = None,
         type_id: int | None = None,
         collection_id: int | None = None,
+        limit: int | None = None,
     ) -> list[CollectedItem]:
         """Get collected items for a user.
 
@@ -125,6 +127,8 @@ class UserService(UserServiceBase):
             Filter by type ID
         collection_id : int | None
             Filter by collection ID
+        limit : int | None
+            Maximum number of items to return; items past it are never validated
 
         Returns
         -------
@@ -137,11 +141,12 @@ class UserService(UserServiceBase):
             If user not found or API error
         """
         logger.debug(
-            "→ get_collected_items(user_id=%s, category=%s, type_id=%s, collection_id=%s)",
+            "→ get_collected_items(user_id=%s, category=%s, type_id=%s, collection_id=%s, limit=%s)",
             user_id,
             category,
             type_id,
             collection_id,
+            limit,
         )
 
         params = self._build_params(
@@ -156,10 +161,9 @@ class UserService(UserServiceBase):
         self._track_response(response)
         data = cast(Mapping[str, Any], response.json())
 
-        items_list = [
-            CollectedItem.model_validate(item)
-            for item in data.get("collected_items", [])
-        ]
+        # Slice before validating so a small limit on a large collection stays cheap
+        items_raw = islice(data.get("collected_items", []), limit)
+        items_list = [CollectedItem.model_validate(item) for item in items_raw]
 
         logger.info(
             f"Retrieved {len(items_list)} collected items for user {user_id} {response.cached_indicator}"
@@ -234,6 +238,7 @@ class UserService(UserServiceBase):
         category: str | None = None,
         type_id: int | None = None,
         collection_id: int | None = None,
+        limit: int | None = None,
     ) -> list[CollectedItem]:
         """Get collected items for a user (async).
 
@@ -247,6 +252,8 @@ class UserService(UserServiceBase):
             Filter by type ID
         collection_id : int | None
             Filter by collection ID
+        limit : int | None
+            Maximum number of items to return; items past it are never validated
 
         Returns
         -------
@@ -259,11 +266,12 @@ class UserService(UserServiceBase):
             If user not found or API error
         """
         logger.debug(
-            "→ get_collected_items_async(user_id=%s, category=%s, type_id=%s, collection_id=%s)",
+            "→ get_collected_items_async(user_id=%s, category=%s, type_id=%s, collection_id=%s, limit=%s)",
             user_id,
             category,
             type_id,
             collection_id,
+            limit,
         )
 
         params = self._build_params(
@@ -275,10 +283,9 @@ class UserService(UserServiceBase):
         self._track_response(response)
         data = cast(Mapping[str, Any], response.json())
 
-        items_list = [
-            CollectedItem.model_validate(item)
-            for item in data.get("collected_items", [])
-        ]
+        # Slice before validating so a small limit on a large collection stays cheap
+        items_raw = islice(data.get("collected_items", []), limit)
+        items_list = [CollectedItem.model_validate(item) for item in items_raw]
 
         logger.info(
             f"Retrieved {len(items_list)} collected items for user {user_id} {response.cached_indicator}"
@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures for numistalib tests."""
 
+import json
 from typing import Any
 from unittest.mock import Mock
 
@@ -22,6 +23,10 @@ class DummyResponse:
     def json(self) -> dict[str, Any]:
         return self._data
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._data).encode()
+
 
 class DummyClient:
     """Mock client for testing services without network calls."""
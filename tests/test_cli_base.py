@@ -0,0 +1,157 @@
+"""Unit tests for shared CLI helpers in `numistalib.cli.base`."""
+
+import asyncio
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from numistalib.cli import base as cli_base
+from numistalib.cli.base import LANG_OPTION, pluralize, run_async
+from numistalib.client import NumistaClientAsync, NumistaClientSync
+from numistalib.config import Settings, get_settings
+from numistalib.services import IssuerService, MintService
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings() -> None:
+    # Tests set NUMISTA_API_KEY via monkeypatch; drop settings cached by earlier tests
+    get_settings.cache_clear()
+
+
+def test_run_async_returns_coroutine_result() -> None:
+    async def _answer() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert run_async(_answer()) == 42
+
+
+def test_lang_option_is_reusable_across_commands() -> None:
+    @click.command()
+    @LANG_OPTION
+    def first(lang: str) -> None:
+        click.echo(lang)
+
+    @click.command()
+    @LANG_OPTION
+    def second(lang: str) -> None:
+        click.echo(lang)
+
+    runner = CliRunner()
+    assert runner.invoke(first, ["--lang", "fr"]).output.strip() == "fr"
+    assert runner.invoke(second, []).output.strip() == "en"
+    assert runner.invoke(second, ["--lang", "de"]).exit_code != 0
+
+
+def test_choices_are_case_insensitive_and_canonical() -> None:
+    assert cli_base.LANG_CHOICE.convert("FR", None, None) is cli_base.LANGUAGES[2]
+    assert cli_base.CATEGORY_CHOICE.convert("Coin", None, None) == "coin"
+
+
+def test_pluralize_singular_and_plural() -> None:
+    assert pluralize(0, "issuer") == "0 issuers"
+    assert pluralize(1, "issuer") == "1 issuer"
+    assert pluralize(2, "price estimate") == "2 price estimates"
+
+
+def test_get_service_reuses_instance_and_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUMISTA_API_KEY", "test-key")
+    monkeypatch.setattr(cli_base, "_CLIENTS", {})
+    monkeypatch.setattr(cli_base, "_SERVICES", {})
+
+    mints = cli_base.get_service(MintService)
+    assert cli_base.get_service(MintService) is mints
+    assert cli_base.get_service(IssuerService)._client is mints._client
+    assert cli_base.get_service(IssuerService, use_async=True)._client is not mints._client
+
+
+def test_run_async_reuses_event_loop() -> None:
+    async def _loop() -> asyncio.AbstractEventLoop:
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    assert run_async(_loop()) is run_async(_loop())
+
+
+def test_get_client_accessors_share_cached_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUMISTA_API_KEY", "test-key")
+    monkeypatch.setattr(cli_base, "_CLIENTS", {})
+    monkeypatch.setattr(cli_base, "_SERVICES", {})
+
+    sync_client = cli_base.get_client()
+    assert cli_base.get_client() is sync_client
+    assert isinstance(sync_client, NumistaClientSync)
+    assert cli_base.get_service(MintService)._client is sync_client
+
+    async_client = cli_base.get_async_client()
+    assert cli_base.get_async_client() is async_client
+    assert isinstance(async_client, NumistaClientAsync)
+
+
+def test_get_client_is_keyed_by_transport_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli_base, "_CLIENTS", {})
+
+    fast = Settings(api_key="test-key", timeout=5.0)
+    assert cli_base.get_client(fast) is cli_base.get_client(Settings(api_key="test-key", timeout=5.0))
+    assert cli_base.get_client(Settings(api_key="test-key", timeout=60.0)) is not cli_base.get_client(fast)
+
+
+def test_get_client_default_matches_explicit_environment_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUMISTA_API_KEY", "test-key")
+    monkeypatch.setattr(cli_base, "_CLIENTS", {})
+
+    assert cli_base.get_client() is cli_base.get_client(get_settings())
+    assert len(cli_base._CLIENTS) == 1
+
+
+def test_get_settings_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUMISTA_API_KEY", "first-key")
+    settings = get_settings()
+    monkeypatch.setenv("NUMISTA_API_KEY", "second-key")
+    assert get_settings() is settings
+    assert settings.api_key == "first-key"
+
+    get_settings.cache_clear()
+    assert get_settings().api_key == "second-key"
+
+
+def test_lazy_group_imports_subcommands_on_demand() -> None:
+    import sys
+
+    from numistalib.cli.users import register_users_commands
+
+    @click.group()
+    def root() -> None:
+        pass
+
+    sys.modules.pop("numistalib.cli.user_commands", None)
+    cli_base.LazyGroup._load.cache_clear()
+    register_users_commands(root)
+    assert "numistalib.cli.user_commands" not in sys.modules
+
+    result = CliRunner().invoke(root, ["users", "search", "-q", "john"])
+    assert result.exit_code == 0
+    assert "not yet implemented" in result.output
+    assert "numistalib.cli.user_commands" in sys.modules
+    assert root.commands["users"].list_commands(click.Context(root)) == ["get", "search"]
+
+
+def test_cli_service_reports_errors_and_exits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUMISTA_API_KEY", "test-key")
+    monkeypatch.setattr(cli_base, "_CLIENTS", {})
+    monkeypatch.setattr(cli_base, "_SERVICES", {})
+    handled: list[tuple[str, str, str]] = []
+
+    def _handle(self: MintService, err: Exception, context: str, command: str) -> None:
+        handled.append((str(err), context, command))
+        raise SystemExit(1)
+
+    monkeypatch.setattr(MintService, "handle_cli_error", _handle)
+
+    with cli_base.cli_service(MintService, "listing mints", "mints-list") as (_, service):
+        assert service is cli_base.get_service(MintService)
+
+    with pytest.raises(SystemExit), cli_base.cli_service(MintService, "listing mints", "mints-list"):
+        raise ValueError("boom")
+    assert handled == [("boom", "listing mints", "mints-list")]
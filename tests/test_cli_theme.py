@@ -0,0 +1,164 @@
+"""Unit tests for CLI theming helpers in `numistalib.cli.theme`."""
+
+import io
+
+import pytest
+from rich.console import Group
+
+from numistalib.cli.theme import BufferedConsole, CLISettings, TableWriter
+from numistalib.models import Mint, TypeBasic
+
+
+def test_console_is_cached_buffered_console() -> None:
+    console = CLISettings.console()
+    assert isinstance(console, BufferedConsole)
+    assert CLISettings.console() is console
+    assert console._highlight is False
+
+
+def test_bulk_console_is_cached_and_shares_theme() -> None:
+    bulk = CLISettings.bulk_console()
+    assert CLISettings.bulk_console() is bulk
+    assert bulk is not CLISettings.console()
+    assert CLISettings.theme() is CLISettings.theme()
+
+
+def test_buffered_console_emits_one_line_per_writeln() -> None:
+    console = BufferedConsole(width=40, color_system=None)
+    with console.capture() as capture:
+        console.write("Name: ")
+        console.write("[bold]Paris[/bold]")
+        console.writeln(" (A)")
+        console.writeln("done")
+    assert capture.get() == "Name: Paris (A)\ndone\n"
+
+
+def test_bulk_console_skips_highlighting_and_soft_wrap() -> None:
+    bulk = CLISettings.bulk_console()
+    assert bulk is not CLISettings.console()
+    assert bulk._highlight is False
+    assert bulk.soft_wrap is False
+
+
+def test_add_model_row_uses_model_field_order() -> None:
+    mint = Mint.model_validate({"id": 1, "name": "Paris", "code": "A"})
+    table = CLISettings.create_table(include_cache_column=True)
+    CLISettings.add_columns_to_table(table, CLISettings.infer_columns_from_model(Mint))
+    CLISettings.add_model_row(table, mint, cache_indicator="💾")
+    cells = [next(iter(column.cells)) for column in table.columns]
+    assert cells[:3] == ["💾", "1", "Paris"]
+    # Unset optional fields still get an (empty) cell so later columns stay aligned
+    assert len(cells) == len(table.columns)
+    assert cells[1 + list(Mint.model_fields).index("code")] == "A"
+
+
+def test_cli_theme_is_read_only() -> None:
+    with pytest.raises(TypeError):
+        CLISettings.CLI_THEME["info"] = "red"  # type: ignore[index]
+    assert CLISettings.theme().styles["info"].color is not None
+
+
+def test_format_detail_fields_matches_single_field_template() -> None:
+    fields = [("Name", "Paris"), ("Code", None)]
+    expected = "\n".join(CLISettings.format_detail_field(label, value) for label, value in fields)
+    assert CLISettings.format_detail_fields(fields) == expected == "[label]Name:[/label] Paris\n[label]Code:[/label] —"
+
+
+def test_infer_columns_from_model_is_cached_tuple() -> None:
+    columns = CLISettings.infer_columns_from_model(Mint, include_cache=True)
+    assert columns[:3] == ("Cache", "Id", "Name")
+    assert CLISettings.infer_columns_from_model(Mint, include_cache=True) is columns
+
+
+def test_declared_widths_fix_columns_without_wrapping() -> None:
+    widths = CLISettings.infer_column_widths_from_model(TypeBasic, include_cache=True)
+    columns = CLISettings.infer_columns_from_model(TypeBasic, include_cache=True)
+    assert len(widths) == len(columns)
+    assert widths[:4] == (6, 10, None, 8)
+
+    table = CLISettings.create_table()
+    CLISettings.add_columns_to_table(table, columns, widths)
+    assert (table.columns[1].width, table.columns[1].no_wrap, table.columns[1].overflow) == (10, True, "ellipsis")
+    assert table.columns[2].width is None
+
+
+def test_table_writer_flushes_in_chunks() -> None:
+    class _Live:
+        refreshes = 0
+
+        def refresh(self) -> None:
+            self.refreshes += 1
+
+    table = CLISettings.create_table()
+    table.add_column("Id")
+    live = _Live()
+    writer = TableWriter(table, live, max_hz=1, chunk=3)  # type: ignore[arg-type]
+    for number in range(7):
+        writer.add((str(number),))
+    assert table.row_count == 6
+    writer.flush()
+    assert table.row_count == writer.rows_written == 7
+    assert live.refreshes == 3
+
+
+def test_panel_flavors_bind_border_style() -> None:
+    panel = CLISettings.panel_danger("boom", title="Error")
+    assert panel.border_style == "panel_danger"
+    assert panel.title == "Error"
+    assert panel.width == CLISettings.PANEL_WIDTH
+    assert CLISettings.panel_info("hi").border_style == "panel_info"
+
+
+def test_create_table_goes_dense_for_large_row_counts() -> None:
+    pretty = CLISettings.create_table(row_count_hint=CLISettings.DENSE_TABLE_ROWS)
+    dense = CLISettings.create_table(row_count_hint=CLISettings.DENSE_TABLE_ROWS + 1)
+    assert pretty.row_styles and pretty.pad_edge
+    assert not dense.row_styles
+    assert not dense.pad_edge
+
+
+def test_add_rows_adds_literal_text_cells() -> None:
+    rows = [("1", "Paris"), ("2", "[bold]Utrecht[/bold]")]
+    table = CLISettings.create_table()
+    CLISettings.add_columns_to_table(table, ("Id", "Name"))
+    CLISettings.add_rows(table, iter(rows))
+
+    assert table.row_count == 2
+    assert [[cell.plain for cell in column.cells] for column in table.columns] == [
+        ["1", "2"],
+        ["Paris", "[bold]Utrecht[/bold]"],
+    ]
+
+
+def test_license_footer_is_prestyled_text() -> None:
+    assert CLISettings.LICENSE_FOOTER.plain == CLISettings.LICENSE_TEXT
+    assert CLISettings.LICENSE_FOOTER.style == "footer"
+
+
+def test_group_print_reaches_the_file_in_one_write() -> None:
+    class _CountingIO(io.StringIO):
+        writes = 0
+
+        def write(self, text: str) -> int:
+            self.writes += 1
+            return super().write(text)
+
+    out = _CountingIO()
+    console = BufferedConsole(file=out, width=80, theme=CLISettings.theme())
+    panels = [CLISettings.panel(title=f"Panel {index}", content="body") for index in range(5)]
+    console.print(Group(*panels, CLISettings.LICENSE_FOOTER))
+    assert out.writes == 1
+    assert "Panel 4" in out.getvalue()
+
+
+def test_status_messages_are_styled_without_markup(monkeypatch: pytest.MonkeyPatch) -> None:
+    console = BufferedConsole(file=io.StringIO(), record=True, width=80, theme=CLISettings.theme())
+    monkeypatch.setattr(CLISettings, "console", classmethod(lambda cls: console))
+
+    CLISettings.print_error("Error in listing mints: bad [key]")
+    CLISettings.print_success("Found 2 mints")
+
+    assert console.export_text(clear=False) == "Error in listing mints: bad [key]\nFound 2 mints\n"
+    assert [segment.style for segment in console._record_buffer if segment.text.startswith("Error")] == [
+        CLISettings.theme().styles["danger"]
+    ]
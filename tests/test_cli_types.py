@@ -0,0 +1,147 @@
+"""Unit tests for the streaming search consumer in `numistalib.cli.types`."""
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncGenerator
+from typing import Any, cast
+
+import click
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from numistalib.cli import types as cli_types
+from numistalib.cli.theme import CLISettings
+from numistalib.models import TypeBasic
+from numistalib.services import TypeBasicService
+from numistalib.services.types.service import SearchParams
+
+PAGE_SIZE = 3
+
+
+class _FakeSearchService:
+    def __init__(self, total: int, fail_after: int | None = None) -> None:
+        self.total = total
+        self.fail_after = fail_after
+
+    async def search_types_paginated_pages(self, **_: Any) -> AsyncGenerator[list[TypeBasic]]:
+        for start in range(1, self.total + 1, PAGE_SIZE):
+            if self.fail_after is not None and start > self.fail_after:
+                raise RuntimeError("page fetch failed")
+            stop = min(start + PAGE_SIZE, self.total + 1)
+            yield [TypeBasic(id=type_id, title=f"Type {type_id}", category="coin") for type_id in range(start, stop)]
+
+
+def _consume(service: _FakeSearchService, max_results: int, max_rows: int | None = None) -> tuple[int, str]:
+    console = Console(record=True, width=120)
+    count = asyncio.run(
+        cli_types._consume_type_search_results(cast(TypeBasicService, service), console, {}, max_results, max_rows)
+    )
+    return count, console.export_text()
+
+
+def test_consume_stops_at_max_results() -> None:
+    count, _ = _consume(_FakeSearchService(total=300), max_results=250)
+    assert count == 250
+
+
+def test_consume_prints_plain_lines_past_max_rows() -> None:
+    count, output = _consume(_FakeSearchService(total=10), max_results=5, max_rows=3)
+    assert count == 5
+    assert "Type 4" in output
+    assert "Type 6" not in output
+
+
+def test_consume_propagates_producer_errors() -> None:
+    with pytest.raises(RuntimeError, match="page fetch failed"):
+        _consume(_FakeSearchService(total=10, fail_after=2), max_results=10)
+
+
+def test_consume_error_leaves_no_pending_producer(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*_args: Any) -> None:
+        raise OSError("broken pipe")
+
+    monkeypatch.setattr(cli_types, "_print_search_batch", _fail)
+
+    async def _run() -> set[asyncio.Task[Any]]:
+        service = cast(TypeBasicService, _FakeSearchService(total=1000))
+        consume = cli_types._consume_type_search_results(service, Console(), {}, 1000)
+        with pytest.raises(OSError, match="broken pipe"):
+            await asyncio.wait_for(consume, timeout=5)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(_run()) == set()
+
+
+def test_write_plain_search_results_tsv_and_json() -> None:
+    service = cast(TypeBasicService, _FakeSearchService(total=10))
+
+    out = io.StringIO()
+    count = asyncio.run(cli_types._write_plain_search_results(service, out, {}, 4, "tsv"))
+    lines = out.getvalue().splitlines()
+    assert count == 4
+    assert lines[0] == cli_types.SEARCH_TSV_HEADER.strip()
+    assert lines[1].split("\t")[:3] == ["1", "Type 1", "coin"]
+    assert len(lines) == 5
+
+    out = io.StringIO()
+    asyncio.run(cli_types._write_plain_search_results(service, out, {}, 2, "json"))
+    assert [json.loads(line)["title"] for line in out.getvalue().splitlines()] == ["Type 1", "Type 2"]
+
+
+def test_stream_search_table_renders_rows_live() -> None:
+    console = Console(theme=CLISettings.theme(), record=True, width=120)
+    count = asyncio.run(
+        cli_types._stream_search_table(cast(TypeBasicService, _FakeSearchService(total=10)), console, {}, 7)
+    )
+    output = console.export_text()
+    assert count == 7
+    assert "Numista ID" in output
+    assert "Type 7" in output
+    assert "Type 8" not in output
+
+
+class _FakeSyncSearchService:
+    def __init__(self) -> None:
+        self.params: list[SearchParams] = []
+
+    def search_types(self, params: SearchParams) -> list[TypeBasic]:
+        self.params.append(params)
+        return [TypeBasic(id=type_id, title=f"Type {type_id}", category="coin") for type_id in range(1, 11)]
+
+
+def test_single_page_search_skips_event_loop(capsys: pytest.CaptureFixture[str]) -> None:
+    service = _FakeSyncSearchService()
+    params = {"query": "dollar", "issuer": None, "year": None, "category": None, "limit": 4, "lang": "fr"}
+
+    results = cli_types._search_single_page(cast(TypeBasicService, service), params)
+    assert [result.numista_id for result in results] == [1, 2, 3, 4]
+    assert (service.params[0].query, service.params[0].count, service.params[0].lang) == ("dollar", 4, "fr")
+
+    assert cli_types._print_search_page(results, "tsv", None) == 4
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == cli_types.SEARCH_TSV_HEADER.strip()
+    assert len(lines) == 5
+
+
+def test_capped_pages_trims_only_the_last_page() -> None:
+    async def _pages() -> list[list[TypeBasic]]:
+        service = cast(TypeBasicService, _FakeSearchService(total=10))
+        return [page async for page in cli_types._capped_pages(service, {}, 7)]
+
+    pages = asyncio.run(_pages())
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [result.numista_id for result in pages[-1]] == [7]
+
+
+@pytest.mark.parametrize("limit", ["0", "-5"])
+def test_search_rejects_non_positive_limit(limit: str) -> None:
+    @click.group()
+    def cli() -> None:
+        pass
+
+    cli_types.register_types_commands(cli)
+    result = CliRunner().invoke(cli, ["types", "search", "-q", "dollar", "--limit", limit])
+    assert result.exit_code == 2
+    assert "--limit" in result.output
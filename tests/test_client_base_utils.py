@@ -2,15 +2,31 @@
 
 Covers:
 - `NumistaClientSync._build_url()` relative vs absolute
-- `NumistaClient._wrap_response()` cached indicator
+- `NumistaResponse.from_httpx()` cached indicator
 - `NumistaClientSync.database_full_path` directory creation
+- `NumistaResponse.json()` decoder selection
+- Rate-limit throttling on the network transport
+- Retry rules and async concurrency cap
 """
 
+import asyncio
+import json
+import time
 from pathlib import Path
+from typing import Any
 
 import httpx
+import pytest
 
-from numistalib.client import NumistaClientSync, NumistaResponse
+from numistalib import client as client_module
+from numistalib.client import (
+    AdaptiveConcurrency,
+    AsyncRateLimitedTransport,
+    NumistaClientAsync,
+    NumistaClientSync,
+    NumistaResponse,
+    RateLimitedTransport,
+)
 
 
 def test_build_url_relative_and_absolute() -> None:
@@ -19,15 +35,15 @@ def test_build_url_relative_and_absolute() -> None:
     assert client._build_url("https://example.com/x") == "https://example.com/x"
 
 
-def test_wrap_response_cached_indicator_true() -> None:
-    client = NumistaClientSync(api_key="test-key")
+def test_from_httpx_cached_indicator_true() -> None:
     resp = httpx.Response(
         200,
         request=httpx.Request("GET", "https://api.numista.com/v3/ping"),
         extensions={"hishel_from_cache": True},
     )
-    wrapped = client._wrap_response(resp)
+    wrapped = NumistaResponse.from_httpx(resp)
     assert isinstance(wrapped, NumistaResponse)
+    assert type(resp) is httpx.Response
     assert wrapped.cached is True
     assert wrapped.cached_indicator == "💾"
 
@@ -38,3 +54,227 @@ def test_database_full_path_creates_directory(tmp_path: Path) -> None:
     # Directory should exist and full path should point to db inside it
     assert Path(full_path).parent.exists()
     assert Path(full_path).name == "x.db"
+
+
+@pytest.mark.parametrize("fast_decoder", [None, json])
+def test_response_json_decodes_with_either_decoder(monkeypatch: pytest.MonkeyPatch, fast_decoder: object) -> None:
+    # json stands in for orjson: both expose loads(bytes), which is all the fast path uses
+    monkeypatch.setattr(client_module, "orjson", fast_decoder)
+    resp = NumistaResponse.from_httpx(httpx.Response(200, content='{"title": "Écu", "id": 1}'.encode()))
+    assert resp.json() == {"title": "Écu", "id": 1}
+    assert resp.json(parse_int=str) == {"title": "Écu", "id": "1"}
+
+
+def test_http2_defaults_to_h2_availability(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "H2_AVAILABLE", False)
+    assert NumistaClientSync(api_key="test-key").http2 is False
+    assert NumistaClientSync(api_key="test-key", http2=None).http2 is False
+    assert NumistaClientSync(api_key="test-key", http2=True).http2 is True
+
+    monkeypatch.setattr(client_module, "H2_AVAILABLE", True)
+    assert NumistaClientSync(api_key="test-key").http2 is True
+    assert NumistaClientSync(api_key="test-key", http2=False).http2 is False
+
+
+def test_connection_pool_limits_default_and_override() -> None:
+    limits = NumistaClientSync(api_key="test-key").limits
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (100, 20, 30.0)
+
+    limits = NumistaClientSync(api_key="test-key", max_connections=4, keepalive_expiry=5).limits
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (4, 20, 5.0)
+
+
+def test_storage_is_built_once_and_released_on_close(tmp_path: Path) -> None:
+    client = NumistaClientSync(api_key="test-key", database_cache_dir=str(tmp_path), database_cache_db="x.db")
+    storage = client.storage
+    assert client.storage is storage
+    assert client.client is client.client
+    client.close()
+    assert client.storage is not storage
+    client.close()
+
+
+def test_rate_and_limiter_are_built_once() -> None:
+    client = NumistaClientSync(api_key="test-key", rate_limit_requests=45, rate_limit_period=60)
+    assert client.limiter is client.limiter
+    assert client.rate is client.rate
+    assert (client.rate.limit, client.rate.interval) == (45, 60_000)
+
+
+def test_throttle_delay_waits_once_window_is_full() -> None:
+    client = NumistaClientSync(api_key="test-key", rate_limit_requests=2, rate_limit_period=60)
+    assert client._throttle_delay() == pytest.approx(0.0)
+    assert client._throttle_delay() == pytest.approx(0.0)
+    assert client._throttle_delay() == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize(
+    ("headers", "min_pause"),
+    [({"Retry-After": "3"}, 2.0), ({"X-RateLimit-Remaining": "1"}, 59.0), ({"X-RateLimit-Remaining": "40"}, None)],
+)
+def test_rate_limited_transport_honours_server_headers(headers: dict[str, str], min_pause: float | None) -> None:
+    client = NumistaClientSync(api_key="test-key", rate_limit_requests=45, rate_limit_period=60)
+    transport = RateLimitedTransport(httpx.MockTransport(lambda _: httpx.Response(200, headers=headers)), client)
+
+    response = transport.handle_request(httpx.Request("GET", "https://api.numista.com/v3/types"))
+    assert response.status_code == 200
+    if min_pause is None:
+        assert client._throttle_delay() == pytest.approx(0.0)
+    else:
+        assert client._throttle_delay() > min_pause
+
+
+def test_verbs_share_one_retrying_request_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module.time, "sleep", lambda _: None)
+    calls: list[tuple[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, str(request.url)))
+        if len(calls) < 3:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = NumistaClientSync(api_key="test-key")
+    client._client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    response = client.delete("/users/1/collected_items/2")
+    assert isinstance(response, NumistaResponse)
+    assert calls == [("DELETE", "https://api.numista.com/v3/users/1/collected_items/2")] * 3
+
+
+def test_only_transient_failures_are_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    statuses: dict[str, list[int]] = {"GET": [429, 503, 200], "POST": [503, 200]}
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/bad"):
+            raise httpx.UnsupportedProtocol("no such scheme", request=request)
+        calls.append(request.method)
+        return httpx.Response(statuses[request.method].pop(0), headers={"Retry-After": "7"})
+
+    client = NumistaClientSync(api_key="test-key")
+    client._client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    assert client.get("/types/1").status_code == 200
+    assert client.post("/types").status_code == 503
+    with pytest.raises(httpx.UnsupportedProtocol):
+        client.get("/bad")
+    assert calls == ["GET", "GET", "GET", "POST"]
+    assert sleeps == [7.0, 7.0]
+
+
+def test_only_successful_responses_are_cached() -> None:
+    cache_filter = client_module.CacheSuccessfulResponses()
+    assert [
+        cache_filter.apply(client_module.Response(status_code=status), None) for status in (200, 204, 404, 429, 503)
+    ] == [True, True, False, False, False]
+
+
+def test_jitter_delay_uses_full_jitter_capped_at_backoff_max() -> None:
+    for attempt in range(8):
+        ceiling = min(client_module.DEFAULT_BACKOFF_BASE * 2**attempt, client_module.DEFAULT_BACKOFF_MAX)
+        assert all(0.0 <= NumistaClientSync._jitter_delay(attempt) <= ceiling for _ in range(50))
+
+
+def test_cache_storage_opens_sqlite_in_wal_mode(tmp_path: Path) -> None:
+    client = NumistaClientSync(api_key="test-key", database_cache_dir=str(tmp_path), database_cache_db="x.db")
+    connection = client.storage._ensure_connection()
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert connection.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+    client.close()
+
+
+def test_async_client_caps_requests_in_flight() -> None:
+    in_flight: list[int] = [0, 0]  # current, peak
+
+    async def _handler(_: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return httpx.Response(200)
+
+    async def _fetch_all() -> None:
+        client = NumistaClientAsync(api_key="test-key", max_concurrency=2)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        await asyncio.gather(*(client.get(f"/types/{type_id}") for type_id in range(6)))
+
+    asyncio.run(_fetch_all())
+    assert in_flight[1] == 2
+
+
+def test_adaptive_concurrency_ramps_up_and_halves_once_per_burst() -> None:
+    controller = AdaptiveConcurrency(maximum=8, target_latency=1.0)
+    assert controller.limit == pytest.approx(client_module.DEFAULT_INITIAL_CONCURRENCY)
+    burst_sent_at = time.monotonic()
+    controller.record_congestion(burst_sent_at)
+    controller.record_congestion(burst_sent_at)  # same burst, already answered by the first decrease
+    assert controller.limit == pytest.approx(2.0)
+    controller.record_congestion(time.monotonic())
+    assert controller.limit == pytest.approx(1.0)
+    controller.record_success(0.2)
+    controller.record_success(0.3)
+    assert controller.limit == pytest.approx(2.0)
+    controller.record_success(5.0)  # window mean now above target
+    assert controller.limit == pytest.approx(2.0)
+
+
+def _aimd_client(handler: Any, max_concurrency: int = 8) -> NumistaClientAsync:
+    client = NumistaClientAsync(api_key="test-key", max_concurrency=max_concurrency)
+    client._client = httpx.AsyncClient(transport=AsyncRateLimitedTransport(httpx.MockTransport(handler), client))
+    return client
+
+
+def test_async_client_halves_once_for_a_burst_of_server_errors() -> None:
+    async def _handler(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(503)
+
+    async def _post_burst() -> float:
+        client = _aimd_client(_handler)
+        responses = await asyncio.gather(*(client.post("/types") for _ in range(4)))
+        assert [response.status_code for response in responses] == [503] * 4
+        return client.concurrency.limit
+
+    assert asyncio.run(_post_burst()) == pytest.approx(2.0)
+
+
+def test_async_client_latency_excludes_throttle_wait() -> None:
+    async def _fetch() -> list[float]:
+        client = _aimd_client(lambda _: httpx.Response(200))
+        client._pause_until = time.monotonic() + 0.05
+        await client.get("/types/1")
+        return list(client.concurrency._latencies)
+
+    latencies = asyncio.run(_fetch())
+    assert len(latencies) == 1
+    assert latencies[0] < 0.05
+
+
+@pytest.mark.parametrize(
+    ("method", "error", "sends"),
+    [
+        ("POST", httpx.ReadTimeout, 1),
+        ("PATCH", httpx.RemoteProtocolError, 1),
+        ("POST", httpx.ConnectError, 3),
+        ("GET", httpx.ReadTimeout, 3),
+    ],
+)
+def test_non_idempotent_methods_retry_only_connect_failures(
+    monkeypatch: pytest.MonkeyPatch, method: str, error: type[httpx.TransportError], sends: int
+) -> None:
+    monkeypatch.setattr(client_module.time, "sleep", lambda _: None)
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        raise error("boom", request=request)
+
+    client = NumistaClientSync(api_key="test-key")
+    client._client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    with pytest.raises(error):
+        client._request(method, "/types")
+    assert calls == [method] * sends
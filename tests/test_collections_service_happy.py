@@ -0,0 +1,41 @@
+"""Unit tests for CollectionService happy path with mocked client.
+
+Covers payload-to-model conversion without network calls.
+"""
+
+from typing import Any
+
+from numistalib.client import NumistaResponse
+from numistalib.services.collections.service import CollectionService
+
+from .conftest import DummyClient, DummyResponse
+
+
+class CollectionServiceDummyClient(DummyClient):
+    def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        if url == "/users/42/collected_items":
+            return DummyResponse({
+                "collected_items": [
+                    {
+                        "id": 7,
+                        "type": {"id": 1, "title": "Test Dollar", "category": "coin"},
+                        "collection": {"id": 3, "name": "Main"},
+                        "private_comment": "from grandpa",
+                        "weight": 12.5,
+                    },
+                    {"id": 8, "quantity": 2, "for_swap": True, "type": {"id": 2, "title": "Cent", "category": "coin"}},
+                ]
+            })  # type: ignore[return-value]
+        raise AssertionError(f"Unexpected URL {url}")
+
+
+def test_get_collected_items_happy_path() -> None:
+    service = CollectionService(CollectionServiceDummyClient())
+    first, second = service.get_collected_items(42)
+
+    assert (first.id, first.quantity, first.for_swap) == (7, 1, False)
+    assert first.type.title == "Test Dollar"
+    assert first.collection is not None
+    assert first.collection.name == "Main"
+    assert (first.private_comment, first.weight, first.grade) == ("from grandpa", 12.5, None)
+    assert (second.quantity, second.for_swap, second.collection) == (2, True, None)
@@ -4,6 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from numistalib.models.catalogues import Catalogue
+from numistalib.models.currency import Currency
 from numistalib.models.issuer import Issuer
 from numistalib.models.types import TypeBasic, TypeFull
 
@@ -229,3 +230,139 @@ def test_type_full_invalid_weight_type() -> None:
             reverse_lettering="",
             weight="invalid",  # type: ignore
         )
+
+
+def test_pretty_columns_humanizes_field_names_once() -> None:
+    """Test pretty_columns title-cases fields in declaration order and is cached per class."""
+    columns = Catalogue.pretty_columns()
+    assert columns == tuple(name.replace("_", " ").title() for name in Catalogue.model_fields)
+    assert Catalogue.pretty_columns() is columns
+    assert Issuer.pretty_columns() is not columns
+
+
+def test_base_render_table_uses_all_fields() -> None:
+    """Test the generic NumistaBaseModel.render_table fallback for models without a curated table."""
+    currency = Currency(numista_id=123, code="USD", name="Dollar", full_name="United States Dollar", symbol="$")
+    table = Currency.render_table([currency], "Currencies")
+    headers = [str(column.header) for column in table.columns]
+    assert headers == ["Numista Id", "Code", "Name", "Full Name", "Symbol", "Display Format"]
+    assert table.row_count == 1
+    assert next(iter(table.columns[-1].cells)) == "$ United States Dollar"
+
+
+def test_formatted_fields_dict_tracks_assignment_and_copies() -> None:
+    """Test formatted_fields_dict reflects field assignment and model_copy updates."""
+    currency = Currency(numista_id=123, name="Dollar", full_name="United States Dollar")
+    assert "Dollar" in currency.formatted_fields_dict["name"]
+    assert "Euro" in currency.model_copy(update={"name": "Euro"}).formatted_fields_dict["name"]
+    currency.name = "Peso"
+    assert "Peso" in currency.formatted_fields_dict["name"]
+
+
+def test_rich_columns_lists_display_fields_once_per_class() -> None:
+    """Test rich_columns covers regular and computed fields and is cached per class."""
+    columns = Currency.rich_columns()
+    assert columns == (*Currency.model_fields, "display_format")
+    assert Currency.rich_columns() is columns
+
+
+def test_rich_widths_collects_declared_column_widths() -> None:
+    """Test rich_widths reads json_schema_extra from regular and computed fields."""
+    widths = TypeBasic.rich_widths()
+    assert widths == {"numista_id": 10, "category": 8, "year_range": 10}
+    assert TypeBasic.rich_widths() is widths
+    assert Currency.rich_widths() == {}
+
+
+def test_render_detail_skips_empty_panels() -> None:
+    """Test render_detail only builds panels for sections that have data."""
+    type_full = TypeFull.model_validate({
+        "id": 1,
+        "title": "Test Dollar",
+        "category": "coin",
+        "issuer": {"code": "us", "name": "United States"},
+    })
+    panels = type_full.render_detail("💾")
+    assert [panel.title for panel in panels] == ["💾 Type Details", "Issuer"]
+
+
+def test_prefetch_thumbnails_downloads_each_image_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test prefetch_thumbnails warms every side and related-type thumbnail before rendering."""
+    import io
+    import threading
+
+    import httpx
+    from PIL import Image
+
+    from numistalib.models import types as type_models
+
+    png = io.BytesIO()
+    Image.new("RGB", (1, 1)).save(png, format="PNG")
+    requested: list[str] = []
+    lock = threading.Lock()
+
+    def fake_get(url: str, **_: object) -> httpx.Response:
+        with lock:
+            requested.append(url)
+        return httpx.Response(200, content=png.getvalue(), request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(type_models.httpx, "get", fake_get)
+    side = {"picture": "https://example.com/p.jpg", "thumbnail": "https://example.com/t.jpg"}
+    type_full = TypeFull.model_validate({
+        "id": 1,
+        "title": "Test Dollar",
+        "category": "coin",
+        "issuer": {"code": "us", "name": "United States"},
+        "obverse": side,
+        "reverse": side,
+        "related_types": [
+            {"id": 2, "title": "Related", "category": "coin", "obverse_thumbnail": "https://example.com/r.jpg"}
+        ],
+    })
+
+    type_full.prefetch_thumbnails()
+    assert sorted(requested) == ["https://example.com/r.jpg", "https://example.com/t.jpg", "https://example.com/t.jpg"]
+
+    type_full.render_detail()
+    assert len(requested) == 3
+
+
+def test_render_detail_styles_tags_without_markup() -> None:
+    """Test tags render as inverse-styled spans, untouched by markup parsing."""
+    type_full = TypeFull.model_validate({
+        "id": 1,
+        "title": "Test Dollar",
+        "category": "coin",
+        "issuer": {"code": "us", "name": "United States"},
+        "tags": ["[bold]", "gold"],
+    })
+    body = type_full.render_detail()[0].renderable
+    assert "Tags:\n[bold] gold" in body.plain
+    assert sum(span.style == "inverse" for span in body.spans) == 2
+
+
+def test_type_basic_render_table_uses_prestyled_cells() -> None:
+    """Test search table cells are Text objects, so titles are never parsed as markup."""
+    type_basic = TypeBasic.model_validate({
+        "id": 1,
+        "title": "[bold] Dollar",
+        "category": "coin",
+        "issuer": {"code": "us", "name": "United States", "wikidata_id": "Q30"},
+    })
+    table = TypeBasic.render_table([type_basic], "Types")
+    title_cell = next(iter(table.columns[1].cells))
+    issuer_cell = next(iter(table.columns[5].cells))
+    assert title_cell.plain == "[bold] Dollar"
+    assert issuer_cell.plain == "United States"
+    assert issuer_cell.style == "link https://www.wikidata.org/wiki/Q30"
+
+
+def test_render_table_columns_are_fresh_per_table() -> None:
+    """Test static column templates are copied, so tables never share cells."""
+    catalogue = Catalogue(numista_id=1, code="KM", title="Standard Catalog", author="Krause")  # type: ignore
+    first = Catalogue.render_table([catalogue], "A")
+    second = Catalogue.render_table([catalogue, catalogue], "B")
+    assert first.row_count == 1
+    assert len(list(first.columns[0].cells)) == 1
+    assert len(list(second.columns[0].cells)) == 2
+    assert [column.header for column in first.columns] == ["ID", "Code", "Title", "Author", "Publisher"]
@@ -4,10 +4,13 @@ Covers:
 - `BaseService._build_params()`
 - `BaseService.last_cache_indicator` default
 - `BaseService._format_panel()` with a simple model stub
+- `BaseService.handle_cli_error()` logging
 """
 
+import logging
 from typing import Any
 
+import pytest
 from rich.panel import Panel
 from rich.text import Text
 
@@ -42,3 +45,16 @@ def test_format_panel_enhances_title_with_cache_indicator() -> None:
     assert isinstance(panel, Panel)
     # Title should include the cache miss indicator and original title
     assert panel.title and panel.title.startswith("🌐 ")
+
+
+def test_handle_cli_error_logs_traceback_only_at_debug(caplog: pytest.LogCaptureFixture) -> None:
+    service = DummyService(DummyClient())
+
+    with caplog.at_level(logging.INFO, logger="numistalib"), pytest.raises(SystemExit):
+        service.handle_cli_error(ValueError("boom"), "listing things", "thing-list")
+    assert caplog.records[-1].getMessage() == "Error in listing things (command: thing-list): boom"
+    assert caplog.records[-1].exc_info is None
+
+    with caplog.at_level(logging.DEBUG, logger="numistalib"), pytest.raises(SystemExit):
+        service.handle_cli_error(ValueError("boom"), "listing things", "thing-list")
+    assert caplog.records[-1].exc_info is not None
@@ -3,10 +3,11 @@
 Covers conversion and logging path without network calls.
 """
 
+import asyncio
 from typing import Any
 
 from numistalib.client import NumistaResponse
-from numistalib.services.types.service import SearchParams, TypeBasicService
+from numistalib.services.types.service import SearchParams, TypeBasicService, TypeFullService
 
 from .conftest import DummyClient, DummyResponse
 
@@ -35,3 +36,125 @@ def test_search_types_happy_path() -> None:
     assert len(items) == 1
     assert items[0].title == "Test Dollar"
     assert items[0].issuer.name == "United States"
+
+
+class TypeFullDummyClient(DummyClient):
+    def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        assert url == "/types/1"
+        picture = {"picture": "https://example.com/a.jpg", "thumbnail": "https://example.com/b.jpg"}
+        return DummyResponse({
+            "id": 1,
+            "title": "Test Dollar",
+            "category": "coin",
+            "issuer": {"code": "us", "name": "United States"},
+            "obverse": picture,
+            "reverse": picture,
+        })  # type: ignore[return-value]
+
+
+def test_get_type_validates_raw_content() -> None:
+    service = TypeFullService(TypeFullDummyClient())
+    type_full = service.get_type(1)
+    assert type_full.title == "Test Dollar"
+    assert type_full.issuer.code == "us"
+
+
+class PagedTypesAsyncClient(DummyClient):
+    TOTAL = 7
+    PER_PAGE = 3
+
+    def __init__(self) -> None:
+        self.pages_requested: list[int] = []
+
+    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        assert url == "/types"
+        page = kwargs["params"].get("page", 1)
+        self.pages_requested.append(page)
+        start = (page - 1) * self.PER_PAGE + 1
+        stop = min(start + self.PER_PAGE, self.TOTAL + 1)
+        types = [{"id": type_id, "title": f"Type {type_id}", "category": "coin"} for type_id in range(start, stop)]
+        return DummyResponse({"count": self.TOTAL, "types": types})  # type: ignore[return-value]
+
+
+def _collect_parallel_pages(client: PagedTypesAsyncClient, max_results: int | None = None) -> list[list[int]]:
+    service = TypeBasicService(client)
+
+    async def collect() -> list[list[int]]:
+        params = SearchParams(query="type", count=PagedTypesAsyncClient.PER_PAGE)
+        pages = service.paginated_search_pages_parallel(params, max_results=max_results, concurrency=2)
+        return [[item.numista_id for item in page] async for page in pages]
+
+    return asyncio.run(collect())
+
+
+def test_parallel_pages_are_yielded_in_order() -> None:
+    client = PagedTypesAsyncClient()
+    assert _collect_parallel_pages(client) == [[1, 2, 3], [4, 5, 6], [7]]
+    assert sorted(client.pages_requested) == [1, 2, 3]
+
+
+def test_parallel_pages_stop_at_max_results() -> None:
+    client = PagedTypesAsyncClient()
+    assert _collect_parallel_pages(client, max_results=4) == [[1, 2, 3], [4, 5, 6]]
+    assert sorted(client.pages_requested) == [1, 2]
+
+
+class CursorOnlyTypesAsyncClient(PagedTypesAsyncClient):
+    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        response = await super().get(url, **kwargs)
+        data = response.json()
+        page = kwargs["params"].get("page", 1)
+        has_next = page * self.PER_PAGE < self.TOTAL
+        return DummyResponse({"types": data["types"], "next_url": "/types?page=next" if has_next else None})  # type: ignore[return-value]
+
+
+def test_parallel_pages_follow_next_url_without_total_count() -> None:
+    client = CursorOnlyTypesAsyncClient()
+    assert _collect_parallel_pages(client) == [[1, 2, 3], [4, 5, 6], [7]]
+    assert client.pages_requested == [1, 2, 3]
+
+
+class ShortFirstPageTypesAsyncClient(PagedTypesAsyncClient):
+    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        response = await super().get(url, **kwargs)
+        data = response.json()
+        if kwargs["params"].get("page", 1) == 1:
+            data["types"] = data["types"][:2]
+        return DummyResponse(data)  # type: ignore[return-value]
+
+
+def test_parallel_pages_plan_from_requested_page_size() -> None:
+    client = ShortFirstPageTypesAsyncClient()
+    assert _collect_parallel_pages(client) == [[1, 2], [4, 5, 6], [7]]
+    assert sorted(client.pages_requested) == [1, 2, 3]
+
+
+class StalledLastPageTypesAsyncClient(PagedTypesAsyncClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled_pages: list[int] = []
+
+    async def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        page = kwargs["params"].get("page", 1)
+        if page == 3:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled_pages.append(page)
+                raise
+        return await super().get(url, **kwargs)
+
+
+def test_parallel_pages_early_exit_awaits_cancelled_pages() -> None:
+    client = StalledLastPageTypesAsyncClient()
+    service = TypeBasicService(client)
+
+    async def take_two_pages() -> set[asyncio.Task[Any]]:
+        params = SearchParams(query="type", count=PagedTypesAsyncClient.PER_PAGE)
+        pages = service.paginated_search_pages_parallel(params, concurrency=2)
+        assert [len(await anext(pages)) for _ in range(2)] == [3, 3]
+        await pages.aclose()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(take_two_pages()) == set()
+    assert client.cancelled_pages == [3]
@@ -13,6 +13,18 @@ from .conftest import DummyClient, DummyResponse
 
 class UserServiceDummyClient(DummyClient):
     def get(self, url: str, **kwargs: Any) -> NumistaResponse:  # type: ignore[override]
+        if url.endswith("/collected_items"):
+            return DummyResponse({
+                "collected_items": [
+                    {
+                        "id": item_id,
+                        "quantity": 1,
+                        "for_swap": False,
+                        "type": {"id": 1, "title": "T", "category": "coin"},
+                    }
+                    for item_id in range(1, 6)
+                ]
+            })  # type: ignore[return-value]
         if url.startswith("/users/") and "/collections" not in url and "/collected_items" not in url:
             return DummyResponse({
                 "user": {
@@ -28,3 +40,9 @@ def test_get_user_happy_path() -> None:
     user = service.get_user(42)
     assert user.numista_id == 42
     assert user.username == "tester"
+
+
+def test_get_collected_items_honours_limit() -> None:
+    service = UserService(UserServiceDummyClient())
+    assert [item.id for item in service.get_collected_items(42, limit=2)] == [1, 2]
+    assert len(service.get_collected_items(42)) == 5